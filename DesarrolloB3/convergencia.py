@@ -0,0 +1,223 @@
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from pregunta_1 import f, runge_kutta_6
+from pregunta_2 import edo2, p, q, r
+"""
+Estudios de convergencia para los solucionadores del bloque 3.
+
+Cada resolución (m para Runge-Kutta, h para diferencias finitas) se ejecuta en
+un proceso distinto. Para cada una se mide el error máximo y L2 contra la
+solución exacta, el tiempo de ejecución y el número de evaluaciones de las
+funciones del problema; luego se estima el orden observado entre resoluciones
+consecutivas y se calcula una extrapolación de Richardson con las dos más finas.
+
+Un "caso" es una función de nivel de módulo (para poder enviarla a los
+procesos) que recibe la resolución y retorna (x, y, evaluaciones).
+"""
+
+
+def caso_rk6(m):
+    """
+    Resuelve el PVI de pregunta_1 con m puntos contando las evaluaciones de f.
+
+    Args:
+        m (int): Número de puntos de la malla.
+
+    Returns:
+        tuple: (x, y, evaluaciones de f).
+    """
+    evaluaciones = [0]
+
+    def f_contada(x, y):
+        evaluaciones[0] += 1
+        return f(x, y)
+
+    x, y = runge_kutta_6(2, 10, 4, m, f=f_contada)
+    return x, y, evaluaciones[0]
+
+
+def caso_edo2(h):
+    """
+    Resuelve el problema de frontera de pregunta_2 con paso h contando las evaluaciones de p, q y r.
+
+    El ensamblaje evalúa cada coeficiente una sola vez sobre todos los nodos, así
+    que se cuentan los puntos evaluados y no las llamadas.
+
+    Args:
+        h (float): Paso de la malla.
+
+    Returns:
+        tuple: (x, y, puntos evaluados de p, q y r).
+    """
+    evaluaciones = [0]
+
+    def contar(fun):
+        def contada(x):
+            evaluaciones[0] += np.size(x)
+            return fun(x)
+        return contada
+
+    x, y = edo2(contar(p), contar(q), contar(r), h, a=1, b=6, y0=1, y_n=0)
+    return x, y, evaluaciones[0]
+
+
+def _calentar(caso, resolucion):
+    # Inicializador de cada proceso: una solución previa que no se mide, para que
+    # la primera resolución no pague la carga de módulos ni la compilación de Numba
+    caso(resolucion)
+
+
+def _ejecutar(caso, resolucion, exacta):
+    # Corre un caso en un proceso trabajador y mide tiempo y errores
+    t0 = time.perf_counter()
+    x, y, evaluaciones = caso(resolucion)
+    tiempo = time.perf_counter() - t0
+
+    error = np.abs(y - exacta(x))
+    # Norma L2 continua aproximada con la regla del trapecio
+    error_l2 = np.sqrt(np.sum(np.diff(x) * (error[:-1]**2 + error[1:]**2) / 2))
+    return {
+        "resolucion": resolucion,
+        "h": float(np.max(np.diff(x))),
+        "error_max": float(np.max(error)),
+        "error_l2": float(error_l2),
+        "tiempo": tiempo,
+        "evaluaciones": evaluaciones,
+        "x": x,
+        "y": y,
+    }
+
+
+def puntos_comunes(x_grueso, x_fino, tol=1e-12):
+    """
+    Ubica los puntos de la malla gruesa que también están en la malla fina.
+
+    Args:
+        x_grueso (np.array): Malla gruesa (ordenada).
+        x_fino (np.array): Malla fina (ordenada).
+        tol (float): Tolerancia para considerar dos nodos iguales.
+
+    Returns:
+        tuple: Índices (i_grueso, i_fino) de los nodos comunes.
+    """
+    j = np.clip(np.searchsorted(x_fino, x_grueso), 1, len(x_fino) - 1)
+    j = np.where(np.abs(x_fino[j - 1] - x_grueso) < np.abs(x_fino[j] - x_grueso), j - 1, j)
+    iguales = np.abs(x_fino[j] - x_grueso) <= tol * max(1.0, np.max(np.abs(x_grueso)))
+    return np.flatnonzero(iguales), j[iguales]
+
+
+def richardson(grueso, fino, orden):
+    """
+    Extrapolación de Richardson en los nodos comunes de dos resoluciones:
+
+        R = y_fino + (y_fino - y_grueso) / ((h_grueso / h_fino)^orden - 1)
+
+    Args:
+        grueso (dict): Resultado de la resolución gruesa.
+        fino (dict): Resultado de la resolución fina.
+        orden (float): Orden de convergencia a usar.
+
+    Returns:
+        tuple: (x, R) en los nodos comunes, o None si las mallas no comparten nodos.
+    """
+    i_g, i_f = puntos_comunes(grueso["x"], fino["x"])
+    if len(i_g) < 2:
+        return None
+    razon = (grueso["h"] / fino["h"]) ** orden
+    y_fino = fino["y"][i_f]
+    return fino["x"][i_f], y_fino + (y_fino - grueso["y"][i_g]) / (razon - 1)
+
+
+def estudio_convergencia(caso, resoluciones, exacta, procesos=None, orden=None):
+    """
+    Ejecuta un caso para varias resoluciones en paralelo y arma la tabla de convergencia.
+
+    Args:
+        caso (callable): Función de nivel de módulo resolucion -> (x, y, evaluaciones).
+        resoluciones (list): Valores de m o h a ejecutar.
+        exacta (callable): Solución exacta y(x) (p. ej. exact_solution o y_exacta).
+        procesos (int): Número de procesos del pool (por defecto os.cpu_count()).
+        orden (float): Orden usado en Richardson; por defecto el último orden observado.
+
+    Returns:
+        tuple: (tabla, extrapolacion). tabla es una lista de diccionarios ordenada de
+        la resolución más gruesa a la más fina con error_max, error_l2, tiempo,
+        evaluaciones y orden (observado respecto a la fila anterior). extrapolacion
+        es un diccionario con x, y y su error máximo, o None.
+    """
+    n = len(resoluciones)
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_calentar,
+                             initargs=(caso, resoluciones[0])) as pool:
+        tabla = list(pool.map(_ejecutar, [caso] * n, resoluciones, [exacta] * n))
+
+    tabla.sort(key=lambda fila: -fila["h"])
+    tabla[0]["orden"] = None
+    for anterior, fila in zip(tabla[:-1], tabla[1:]):
+        if fila["error_max"] > 0 and anterior["error_max"] > 0 and anterior["h"] != fila["h"]:
+            fila["orden"] = float(np.log(anterior["error_max"] / fila["error_max"])
+                                  / np.log(anterior["h"] / fila["h"]))
+        else:
+            fila["orden"] = None
+
+    extrapolacion = None
+    orden = orden if orden is not None else (tabla[-1]["orden"] if n > 1 else None)
+    if orden is not None:
+        resultado = richardson(tabla[-2], tabla[-1], orden)
+        if resultado is not None:
+            x, y = resultado
+            extrapolacion = {"x": x, "y": y, "orden": orden,
+                             "error_max": float(np.max(np.abs(y - exacta(x))))}
+
+    return tabla, extrapolacion
+
+
+def resolucion_mas_barata(tabla, tol):
+    """
+    Elige la resolución con menos evaluaciones cuyo error máximo cumple la tolerancia.
+
+    Args:
+        tabla (list): Tabla retornada por estudio_convergencia.
+        tol (float): Error máximo permitido.
+
+    Returns:
+        dict: Fila elegida, o None si ninguna resolución cumple la tolerancia.
+    """
+    candidatas = [fila for fila in tabla if fila["error_max"] <= tol]
+    return min(candidatas, key=lambda fila: (fila["evaluaciones"], fila["tiempo"])) if candidatas else None
+
+
+def imprimir_tabla(tabla, extrapolacion=None):
+    """
+    Imprime la tabla de convergencia.
+
+    Args:
+        tabla (list): Tabla retornada por estudio_convergencia.
+        extrapolacion (dict): Resultado de Richardson retornado por estudio_convergencia.
+    """
+    print(f"{'resolución':>11} {'h':>10} {'error máx.':>11} {'error L2':>11} {'orden':>7} "
+          f"{'tiempo (s)':>11} {'evaluaciones':>13}")
+    for fila in tabla:
+        orden = f"{fila['orden']:7.3f}" if fila["orden"] is not None else f"{'-':>7}"
+        print(f"{fila['resolucion']:>11} {fila['h']:>10.4g} {fila['error_max']:>11.3e} "
+              f"{fila['error_l2']:>11.3e} {orden} {fila['tiempo']:>11.4f} {fila['evaluaciones']:>13}")
+    if extrapolacion is not None:
+        print(f"Richardson (orden {extrapolacion['orden']:.3f}): error máx. {extrapolacion['error_max']:.3e} "
+              f"en {len(extrapolacion['x'])} nodos comunes")
+
+
+if __name__ == "__main__":
+    from pregunta_1 import exact_solution
+    from pregunta_2 import y_exacta
+
+    print("Runge-Kutta (pregunta_1):")
+    tabla, extrapolacion = estudio_convergencia(caso_rk6, [10, 19, 37, 73, 145, 289], exact_solution)
+    imprimir_tabla(tabla, extrapolacion)
+    elegida = resolucion_mas_barata(tabla, 1e-8)
+    print("Malla más barata con error <= 1e-8:", elegida and elegida["resolucion"])
+
+    print("\nDiferencias finitas (pregunta_2):")
+    tabla, extrapolacion = estudio_convergencia(caso_edo2, [1, 0.5, 0.2, 0.1, 0.05, 0.02, 0.01], y_exacta)
+    imprimir_tabla(tabla, extrapolacion)
+    elegida = resolucion_mas_barata(tabla, 1e-4)
+    print("Malla más barata con error <= 1e-4:", elegida and elegida["resolucion"])
@@ -0,0 +1,399 @@
+import numpy as np
+from tridiagonal import thomas_bandas
+"""
+Diferencias finitas de mayor orden para problemas de frontera lineales
+
+    y'' = p(x) y' + q(x) y + r(x),   x en [a, b]
+
+con condiciones de frontera de Dirichlet, Neumann o Robin. Cada condición se
+da como un número (Dirichlet: y = valor) o como una tupla (alfa, beta, gamma)
+que representa alfa*y + beta*y' = gamma; por ejemplo (0, 1, g) es Neumann.
+
+- edo2_numerov: esquema compacto de cuarto orden (tipo Numerov) en malla
+  uniforme. Con el cambio y = w(x) u, w = exp(1/2 ∫ p), la ecuación queda sin
+  término en u':  u'' = Q u + R,  Q = q + p^2/4 - p'/2,  R = r / w,  y se
+  discretiza con la fórmula de Numerov, que sigue siendo tridiagonal.
+- edo2_no_uniforme: diferencias centradas de segundo orden en una malla
+  arbitraria (p. ej. malla_graduada), para agrupar nodos donde la solución
+  cambia rápido. Sigue siendo de segundo orden: solo mejora la precisión por
+  incógnita cuando la solución tiene una capa límite o un gradiente fuerte
+  localizado; en problemas suaves (como el de pregunta_2) no aporta nada.
+
+En ambos casos las filas de frontera de Robin se reducen a forma tridiagonal
+eliminando el tercer coeficiente con la fila vecina.
+
+- edo2_newton / edo2_newton_continuacion: problemas no lineales
+  y'' = f(x, y, y') con condiciones de Dirichlet. Se aplica el método de Newton
+  al sistema de diferencias centradas; el jacobiano es tridiagonal y cada paso
+  se resuelve con el barrido de Thomas. La continuación en malla resuelve
+  primero en mallas gruesas y usa cada solución como arranque de la siguiente.
+"""
+
+
+def _condicion(c):
+    # Normaliza una condición de frontera a (alfa, beta, gamma)
+    if np.isscalar(c):
+        return 1.0, 0.0, float(c)
+    alfa, beta, gamma = c
+    return float(alfa), float(beta), float(gamma)
+
+
+def _eliminar_tercer_coeficiente(sub, diag, sup, rhs, lado, extra):
+    # La fila de frontera tiene un coeficiente fuera de la banda (sobre y_2 o
+    # y_{n-2}); se elimina restando un múltiplo de la fila vecina
+    if extra == 0.0:
+        return
+    if lado == "a":
+        factor = extra / sup[1]
+        diag[0] -= factor * sub[0]
+        sup[0] -= factor * diag[1]
+        rhs[0] -= factor * rhs[1]
+    else:
+        factor = extra / sub[-2]
+        sub[-1] -= factor * diag[-2]
+        diag[-1] -= factor * sup[-1]
+        rhs[-1] -= factor * rhs[-2]
+
+
+def _evaluar(fun, x):
+    # Evalúa fun una sola vez sobre x; los escalares se extienden a todos los nodos
+    return np.broadcast_to(np.asarray(fun(x), dtype=float), x.shape).copy()
+
+
+def _derivada(fun, x):
+    # Derivada de cuarto orden con paso e = 1e-3 |x| (acotado con el largo del
+    # intervalo) que solo evalúa fun dentro de [x_0, x_n]: centrada en el interior
+    # y con fórmulas de un lado cerca de los extremos, para no cruzar una
+    # singularidad de fun fuera del intervalo
+    a, b = x[0], x[-1]
+    escala = max(abs(a), abs(b))
+    e = 1e-3 * np.clip(np.abs(x), min(1e-3 * escala, b - a), b - a)
+    adelante = x - 2*e < a
+    atras = ~adelante & (x + 2*e > b)
+    centro = ~adelante & ~atras
+
+    # Desplazamientos k*e de cada tipo de fórmula y sus coeficientes (/ 12e)
+    k = np.where(adelante[:, None], np.arange(5),
+                 np.where(atras[:, None], -np.arange(5), np.arange(-2, 3)))
+    coef = np.where(centro[:, None], np.array([1, -8, 0, 8, -1]),
+                    np.array([-25, 48, -36, 16, -3]) * np.where(atras, -1, 1)[:, None])
+    valores = _evaluar(fun, (x[:, None] + k * e[:, None]).ravel()).reshape(k.shape)
+    return np.sum(coef * valores, axis=1) / (12*e)
+
+
+def _integral_acumulada(fun, x):
+    # ∫_{x_0}^{x_i} fun con Gauss-Legendre de 3 puntos en cada celda
+    nodos = np.array([-np.sqrt(3/5), 0.0, np.sqrt(3/5)])
+    pesos = np.array([5/9, 8/9, 5/9])
+    centro = (x[:-1] + x[1:]) / 2
+    radio = np.diff(x) / 2
+    valores = _evaluar(fun, (centro[:, None] + radio[:, None] * nodos).ravel()).reshape(-1, 3)
+    celdas = radio * (valores @ pesos)
+    return np.concatenate(([0.0], np.cumsum(celdas)))
+
+
+def malla_graduada(a, b, n, intensidad=2.0, hacia="a"):
+    """
+    Genera una malla no uniforme de n intervalos que agrupa nodos cerca de un extremo.
+
+    Args:
+        a, b (float): Extremos del intervalo.
+        n (int): Número de intervalos.
+        intensidad (float): Grado de agrupamiento (1 = malla uniforme).
+        hacia (str): "a", "b" o "ambos" (agrupa en los dos extremos).
+
+    Returns:
+        np.array: Nodos x_0 = a < x_1 < ... < x_n = b.
+    """
+    s = np.linspace(0, 1, n + 1)
+    if hacia == "a":
+        t = s ** intensidad
+    elif hacia == "b":
+        t = 1 - (1 - s) ** intensidad
+    elif hacia == "ambos":
+        t = (1 + np.tanh(intensidad * (2*s - 1)) / np.tanh(intensidad)) / 2
+    else:
+        raise ValueError(f"Opción desconocida: hacia = {hacia}")
+    return a + (b - a) * t
+
+
+def edo2_numerov(p, q, r, a, b, n, cond_a, cond_b, dp=None):
+    """
+    Resuelve y'' = p y' + q y + r con el esquema compacto de Numerov (cuarto orden).
+
+    Args:
+        p, q, r (callable): Coeficientes de la ecuación, vectorizados en x.
+        a, b (float): Extremos del intervalo.
+        n (int): Número de intervalos de la malla uniforme (n >= 2).
+        cond_a, cond_b: Condición en a y en b: número (Dirichlet) o (alfa, beta, gamma).
+        dp (callable): Derivada p'(x). Si es None se aproxima numéricamente evaluando p
+            solo dentro de [a, b]; conviene darla si p es singular en un extremo.
+
+    Returns:
+        tuple: (x, y) con la malla uniforme de n+1 nodos y la solución aproximada.
+    """
+    if n < 2:
+        raise ValueError("Se necesitan al menos dos intervalos")
+    x = np.linspace(a, b, n + 1)
+    h = (b - a) / n
+
+    px = _evaluar(p, x)
+    dpx = _evaluar(dp, x) if dp is not None else _derivada(p, x)
+    w = np.exp(_integral_acumulada(p, x) / 2)   # y = w u, w(a) = 1
+    Q = _evaluar(q, x) + px**2 / 4 - dpx / 2
+    R = _evaluar(r, x) / w
+
+    # Filas interiores de Numerov:
+    # (1 - h²Q_{i-1}/12) u_{i-1} - (2 + 10h²Q_i/12) u_i + (1 - h²Q_{i+1}/12) u_{i+1}
+    #     = h²/12 (R_{i-1} + 10 R_i + R_{i+1})
+    c = h**2 / 12
+    sub = np.zeros(n)
+    diag = np.zeros(n + 1)
+    sup = np.zeros(n)
+    rhs = np.zeros(n + 1)
+    sub[:-1] = 1 - c * Q[:-2]
+    diag[1:-1] = -(2 + 10 * c * Q[1:-1])
+    sup[1:] = 1 - c * Q[2:]
+    rhs[1:-1] = c * (R[:-2] + 10 * R[1:-1] + R[2:])
+
+    # Fronteras: alfa y + beta y' = gamma  ->  (alfa + beta p/2) u + beta u' = gamma / w.
+    # u' se aproxima con cuarto orden usando la ecuación en los tres nodos del extremo:
+    # u'_0 = (u_1 - u_0)/h - h (7/24 u''_0 + 1/4 u''_1 - 1/24 u''_2),  u''_j = Q_j u_j + R_j
+    alfa, beta, gamma = _condicion(cond_a)
+    alfa += beta * px[0] / 2
+    diag[0] = alfa - beta/h - beta*h*7/24*Q[0]
+    sup[0] = beta/h - beta*h/4*Q[1]
+    rhs[0] = gamma / w[0] + beta*h*(7/24*R[0] + R[1]/4 - R[2]/24)
+    _eliminar_tercer_coeficiente(sub, diag, sup, rhs, "a", beta*h/24*Q[2])
+
+    # u'_n = (u_n - u_{n-1})/h + h (7/24 u''_n + 1/4 u''_{n-1} - 1/24 u''_{n-2})
+    alfa, beta, gamma = _condicion(cond_b)
+    alfa += beta * px[-1] / 2
+    diag[-1] = alfa + beta/h + beta*h*7/24*Q[-1]
+    sub[-1] = -beta/h + beta*h/4*Q[-2]
+    rhs[-1] = gamma / w[-1] - beta*h*(7/24*R[-1] + R[-2]/4 - R[-3]/24)
+    _eliminar_tercer_coeficiente(sub, diag, sup, rhs, "b", -beta*h/24*Q[-3])
+
+    u = thomas_bandas(sub, diag, sup, rhs)
+    return x, w * u
+
+
+def edo2_no_uniforme(p, q, r, x, cond_a, cond_b):
+    """
+    Resuelve y'' = p y' + q y + r con diferencias centradas en una malla no uniforme.
+
+    Args:
+        p, q, r (callable): Coeficientes de la ecuación, vectorizados en x.
+        x (np.array): Nodos de la malla, crecientes (al menos 3), p. ej. de malla_graduada.
+        cond_a, cond_b: Condición en x[0] y en x[-1]: número (Dirichlet) o (alfa, beta, gamma).
+
+    Returns:
+        tuple: (x, y) con la malla y la solución aproximada.
+    """
+    x = np.asarray(x, dtype=float)
+    if len(x) < 3 or np.any(np.diff(x) <= 0):
+        raise ValueError("La malla debe ser creciente y tener al menos 3 nodos")
+    n = len(x) - 1
+    xi = x[1:-1]
+    hl = xi - x[:-2]     # x_i - x_{i-1}
+    hr = x[2:] - xi      # x_{i+1} - x_i
+    pj, qj, rj = _evaluar(p, xi), _evaluar(q, xi), _evaluar(r, xi)
+
+    sub = np.zeros(n)
+    diag = np.zeros(n + 1)
+    sup = np.zeros(n)
+    rhs = np.zeros(n + 1)
+
+    # y'' - p y' - q y = r con las fórmulas de tres puntos para y'' y y'
+    sub[:-1] = (2 + pj * hr) / (hl * (hl + hr))
+    diag[1:-1] = -2 / (hl * hr) - pj * (hr - hl) / (hl * hr) - qj
+    sup[1:] = (2 - pj * hl) / (hr * (hl + hr))
+    rhs[1:-1] = rj
+
+    # y'(x_0) con la fórmula de tres puntos hacia adelante (segundo orden)
+    h0, h1 = x[1] - x[0], x[2] - x[1]
+    alfa, beta, gamma = _condicion(cond_a)
+    diag[0] = alfa - beta * (2*h0 + h1) / (h0 * (h0 + h1))
+    sup[0] = beta * (h0 + h1) / (h0 * h1)
+    rhs[0] = gamma
+    _eliminar_tercer_coeficiente(sub, diag, sup, rhs, "a", -beta * h0 / (h1 * (h0 + h1)))
+
+    # y'(x_n) con la fórmula de tres puntos hacia atrás
+    hn, hm = x[-1] - x[-2], x[-2] - x[-3]
+    alfa, beta, gamma = _condicion(cond_b)
+    diag[-1] = alfa + beta * (2*hn + hm) / (hn * (hn + hm))
+    sub[-1] = -beta * (hn + hm) / (hn * hm)
+    rhs[-1] = gamma
+    _eliminar_tercer_coeficiente(sub, diag, sup, rhs, "b", beta * hn / (hm * (hn + hm)))
+
+    return x, thomas_bandas(sub, diag, sup, rhs)
+
+
+def _parcial(f, x, y, z, respecto):
+    # Derivada parcial centrada de f respecto a y (respecto=1) o a z = y' (respecto=2)
+    e = 1e-6 * np.maximum(1.0, np.abs(y if respecto == 1 else z))
+    if respecto == 1:
+        return (_evaluar_f(f, x, y + e, z) - _evaluar_f(f, x, y - e, z)) / (2*e)
+    return (_evaluar_f(f, x, y, z + e) - _evaluar_f(f, x, y, z - e)) / (2*e)
+
+
+def _evaluar_f(f, x, y, z):
+    return np.broadcast_to(np.asarray(f(x, y, z), dtype=float), x.shape)
+
+
+def edo2_newton(f, a, b, ya, yb, n, y_inicial=None, fy=None, fz=None,
+                tol=1e-10, iterMax=50):
+    """
+    Resuelve el problema no lineal y'' = f(x, y, y'), y(a) = ya, y(b) = yb con Newton.
+
+    El residuo en cada nodo interior es
+        F_i = (y_{i-1} - 2 y_i + y_{i+1}) / h^2 - f(x_i, y_i, (y_{i+1} - y_{i-1}) / (2h))
+    y su jacobiano es tridiagonal; las derivadas parciales f_y y f_{y'} se evalúan
+    de una vez en todos los nodos (dadas por el usuario o por diferencias finitas).
+
+    Args:
+        f (callable): f(x, y, yp) vectorizada.
+        a, b (float): Extremos del intervalo.
+        ya, yb (float): Condiciones de frontera.
+        n (int): Número de intervalos de la malla uniforme.
+        y_inicial (np.array o callable): Arranque en los n+1 nodos o función de x
+            (por defecto la recta entre las condiciones de frontera).
+        fy, fz (callable): Derivadas parciales de f respecto a y y a y' (opcionales).
+        tol (float): Tolerancia sobre max |delta y|.
+        iterMax (int): Máximo de iteraciones de Newton.
+
+    Returns:
+        tuple: (x, y, info) con la malla, la solución y un diccionario con las
+        iteraciones y la norma máxima del residuo final.
+    """
+    x = np.linspace(a, b, n + 1)
+    h = (b - a) / n
+    if y_inicial is None:
+        y = ya + (yb - ya) * (x - a) / (b - a)
+    elif callable(y_inicial):
+        y = np.asarray(y_inicial(x), dtype=float).copy()
+    else:
+        y = np.asarray(y_inicial, dtype=float).copy()
+    y[0], y[-1] = ya, yb
+    xi = x[1:-1]
+
+    def residuo(y):
+        z = (y[2:] - y[:-2]) / (2*h)
+        return (y[:-2] - 2*y[1:-1] + y[2:]) / h**2 - _evaluar_f(f, xi, y[1:-1], z)
+
+    F = residuo(y)
+    for k in range(1, iterMax + 1):
+        z = (y[2:] - y[:-2]) / (2*h)
+        dfy = _evaluar_f(fy, xi, y[1:-1], z) if fy is not None else _parcial(f, xi, y[1:-1], z, 1)
+        dfz = _evaluar_f(fz, xi, y[1:-1], z) if fz is not None else _parcial(f, xi, y[1:-1], z, 2)
+
+        # Jacobiano tridiagonal de F respecto a y_1, ..., y_{n-1}
+        sub = 1/h**2 + dfz[1:] / (2*h)
+        diag = -2/h**2 - dfy
+        sup = 1/h**2 - dfz[:-1] / (2*h)
+        delta = thomas_bandas(sub, diag, sup, -F)
+
+        # Amortiguamiento: se reduce el paso mientras el residuo no disminuya
+        paso = 1.0
+        norma = np.max(np.abs(F))
+        for _ in range(10):
+            y_nuevo = y.copy()
+            y_nuevo[1:-1] += paso * delta
+            F_nuevo = residuo(y_nuevo)
+            if np.max(np.abs(F_nuevo)) <= norma or paso < 1e-3:
+                break
+            paso /= 2
+        y, F = y_nuevo, F_nuevo
+
+        if np.max(np.abs(paso * delta)) < tol:
+            return x, y, {"iteraciones": k, "residuo": float(np.max(np.abs(F)))}
+
+    raise ValueError("El método de Newton no convergió después del número máximo de iteraciones.")
+
+
+def edo2_newton_continuacion(f, a, b, ya, yb, n, n_inicial=8, **opciones):
+    """
+    Newton con continuación en malla: resuelve con n_inicial intervalos, duplica la
+    malla usando la solución anterior (interpolada) como arranque y repite hasta n.
+
+    En las mallas finas Newton arranca muy cerca de la solución y suele converger
+    en una o dos iteraciones.
+
+    Args:
+        f (callable): f(x, y, yp) vectorizada.
+        a, b (float): Extremos del intervalo.
+        ya, yb (float): Condiciones de frontera.
+        n (int): Número de intervalos de la malla final.
+        n_inicial (int): Número de intervalos de la malla más gruesa.
+        **opciones: Argumentos adicionales para edo2_newton (fy, fz, tol, iterMax, y_inicial).
+
+    Returns:
+        tuple: (x, y, info) con la solución en la malla final; info["iteraciones"] es
+        la lista de iteraciones de Newton por nivel de malla.
+    """
+    mallas = [n]
+    while mallas[-1] // 2 >= n_inicial:
+        mallas.append(mallas[-1] // 2)
+    mallas.reverse()
+
+    iteraciones = []
+    x = y = None
+    for m in mallas:
+        if x is not None:
+            opciones["y_inicial"] = np.interp(np.linspace(a, b, m + 1), x, y)
+        x, y, info = edo2_newton(f, a, b, ya, yb, m, **opciones)
+        iteraciones.append(info["iteraciones"])
+
+    return x, y, {"iteraciones": iteraciones, "mallas": mallas, "residuo": info["residuo"]}
+
+
+if __name__ == "__main__":
+    from pregunta_2 import edo2, p, q, r, y_exacta
+
+    # Derivada de la solución exacta para probar una condición de Neumann en x = 6
+    def dy_exacta(x):
+        return (-np.cos(6 - x) / np.sqrt(x) - np.sin(6 - x) / (2 * x**1.5)) / np.sin(5)
+
+    print(f"{'n':>6} {'edo2 (2º orden)':>16} {'Numerov':>11} {'Numerov Robin':>14}")
+    for n in [10, 20, 40, 80, 160, 320]:
+        x, y = edo2(p, q, r, 5 / n, 1, 6, 1, 0)
+        e_edo2 = np.max(np.abs(y - y_exacta(x)))
+
+        x, y = edo2_numerov(p, q, r, 1, 6, n, 1, 0)
+        e_numerov = np.max(np.abs(y - y_exacta(x)))
+
+        x, y = edo2_numerov(p, q, r, 1, 6, n, 1, (0, 1, dy_exacta(6)))
+        e_robin = np.max(np.abs(y - y_exacta(x)))
+
+        print(f"{n:>6} {e_edo2:>16.3e} {e_numerov:>11.3e} {e_robin:>14.3e}")
+
+    # Capa límite en x = 0: eps y'' + y' = 0, y(0) = 0, y(1) = 1, eps = 0.01,
+    # solución y = (1 - e^{-x/eps}) / (1 - e^{-1/eps}). La malla graduada agrupa
+    # los nodos en la capa; con la misma cantidad de incógnitas el error baja
+    eps = 0.01
+
+    def p_capa(x):
+        return np.full_like(x, -1 / eps)
+
+    def ceros(x):
+        return np.zeros_like(x)
+
+    def y_capa(x):
+        return np.expm1(-x / eps) / np.expm1(-1 / eps)
+
+    print(f"\nCapa límite (eps = {eps})")
+    print(f"{'n':>6} {'uniforme':>11} {'graduada':>11}")
+    for n in [20, 40, 80, 160, 320]:
+        errores = []
+        for malla in [np.linspace(0, 1, n + 1), malla_graduada(0, 1, n, 3, "a")]:
+            x, y = edo2_no_uniforme(p_capa, ceros, ceros, malla, 0, 1)
+            errores.append(np.max(np.abs(y - y_capa(x))))
+        print(f"{n:>6} {errores[0]:>11.3e} {errores[1]:>11.3e}")
+
+    # Problema no lineal y'' = 3/2 y^2, y(0) = 4, y(1) = 1, solución y = 4/(1+x)^2
+    def f_no_lineal(x, y, yp):
+        return 1.5 * y**2
+
+    x, y, info = edo2_newton_continuacion(f_no_lineal, 0, 1, 4, 1, 1024)
+    print("\nNewton con continuación en malla:", info["mallas"], "->", info["iteraciones"],
+          f"iteraciones, error máx. {np.max(np.abs(y - 4 / (1 + x)**2)):.3e}")
@@ -13,16 +13,29 @@ Funciones:
 ----------
 f(x, y):
     Evalúa el lado derecho de la EDO: (x + y) / x.
-runge_kutta_6(a, b, y0, m):
+runge_kutta_6(a, b, y0, m, f=f, args=(), densa=False):
     Numéricamente resuelve la EDO usando el método de 6to orden Runge-Kutta.
         Parametros:
         a (float): Valor inicial de x.
         b (float): Valor final de x.
-        y0 (float): Valor inicial de y en x = a.
+        y0 (float o np.ndarray): Valor inicial de y en x = a. Puede ser un arreglo
+            (lote x dimensión del estado) para integrar muchas condiciones iniciales a la vez.
         m (int): Número de puntos con la discretización.
+        f (callable): Lado derecho f(x, y, *args), vectorizado sobre y (por defecto la EDO del enunciado).
+        args (tuple): Parámetros extra para f (escalares o arreglos compatibles con y).
+        densa (bool): Si es True también retorna un objeto SalidaDensa.
     Returns:
         x_points (np.ndarray): Arreglo de valores de x.
-        y_points (np.ndarray): Array de valores aproximados de x.
+        y_points (np.ndarray): Array de valores aproximados de y, de forma (m,) + y0.shape.
+        (SalidaDensa): Interpolante continuo de la solución, solo si densa=True.
+SalidaDensa(x, y, dy):
+    Interpolante de Hermite cúbico por paso construido con los valores de y y de
+    f = y' que el integrador ya calculó. Se evalúa en cualquier arreglo de puntos
+    sin volver a integrar y localiza eventos g(x, y(x)) = 0.
+runge_kutta_6_adaptativo(a, b, y0, f=f, args=(), rtol=1e-8, atol=1e-10, densa=False):
+    Igual que runge_kutta_6, pero el paso h se ajusta por duplicación de paso para
+    cumplir rtol/atol. Retorna la malla aceptada, los valores de y y un diccionario
+    con el número de evaluaciones de f y de pasos aceptados/rechazados.
 exact_solution(x):
     Calcula la solución analítica de la EDO comparando:
         y(x) = x * ln(x / 2) + 2 * x
@@ -42,28 +55,164 @@ Daniel Duarte Cordero
 
 def f(x, y):
     return (x + y) / x
-# Implementación del método de Runge-Kutta de orden 6
-def runge_kutta_6(a, b, y0, m):
+# Salida densa: interpolante de Hermite cúbico en cada paso [x_i, x_{i+1}],
+# construido con y_i, y_{i+1} y las derivadas f_i, f_{i+1} guardadas durante la
+# integración (error local O(h^4)). Se evalúa de forma vectorizada: un solo
+# np.searchsorted ubica el paso de cada punto de consulta. Si la integración
+# fue hacia atrás (x decreciente) los nodos se guardan en orden creciente.
+class SalidaDensa:
+    def __init__(self, x, y, dy):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.dy = np.asarray(dy, dtype=float)
+        if len(self.x) > 1 and self.x[0] > self.x[-1]:
+            self.x, self.y, self.dy = self.x[::-1], self.y[::-1], self.dy[::-1]
+
+    def __call__(self, xq):
+        xq = np.asarray(xq, dtype=float)
+        t_q = xq.ravel()
+        if np.any(t_q < self.x[0]) or np.any(t_q > self.x[-1]):
+            raise ValueError(f"Los puntos deben estar en [{self.x[0]}, {self.x[-1]}]")
+
+        i = np.clip(np.searchsorted(self.x, t_q, side="right") - 1, 0, len(self.x) - 2)
+        forma = (-1,) + (1,) * (self.y.ndim - 1)  # Para difundir sobre el lote
+        h = (self.x[i + 1] - self.x[i]).reshape(forma)
+        t = ((t_q - self.x[i]) / (self.x[i + 1] - self.x[i])).reshape(forma)
+
+        # Bases de Hermite cúbicas
+        h00 = (1 + 2*t) * (1 - t)**2
+        h10 = t * (1 - t)**2
+        h01 = t**2 * (3 - 2*t)
+        h11 = t**2 * (t - 1)
+
+        y = h00*self.y[i] + h10*h*self.dy[i] + h01*self.y[i + 1] + h11*h*self.dy[i + 1]
+        return y.reshape(xq.shape + self.y.shape[1:])
+
+    # Localiza las raíces de g(x, y(x)) = 0 sobre el interpolante (sin volver a
+    # integrar). g recibe un arreglo de x (M,) y los valores y (M, ...) y debe
+    # retornar (M,). Se muestrea g en `submuestreo` puntos por paso y todos los
+    # cambios de signo se refinan a la vez por bisección vectorizada.
+    def eventos(self, g, submuestreo=4, tol=1e-12, max_iter=200):
+        h = np.diff(self.x)
+        fracciones = np.arange(submuestreo) / submuestreo
+        xs = np.append((self.x[:-1, None] + h[:, None] * fracciones).ravel(), self.x[-1])
+        gs = np.asarray(g(xs, self(xs)), dtype=float)
+
+        raices = list(xs[gs == 0])
+        k = np.flatnonzero(gs[:-1] * gs[1:] < 0)
+        lo, hi, g_lo = xs[k], xs[k + 1], gs[k]
+
+        for _ in range(max_iter):
+            if lo.size == 0 or np.max(hi - lo) <= tol:
+                break
+            medio = (lo + hi) / 2
+            g_medio = np.asarray(g(medio, self(medio)), dtype=float)
+            izquierda = g_lo * g_medio <= 0  # La raíz queda en [lo, medio]
+            hi = np.where(izquierda, medio, hi)
+            lo = np.where(izquierda, lo, medio)
+            g_lo = np.where(izquierda, g_lo, g_medio)
+
+        raices.extend((lo + hi) / 2)
+        return np.sort(np.array(raices))
+
+# Un paso del método de Runge-Kutta desde (x_old, y_old) con tamaño h.
+# f0 = f(x_old, y_old) se puede pasar si ya se conoce (ahorra una evaluación)
+def paso_rk6(f, x_old, y_old, h, args=(), f0=None):
+    # Cálculo de los coeficientes intermedios
+    k1 = h * (f(x_old, y_old, *args) if f0 is None else f0)
+    k2 = h * f(x_old + h/3, y_old + k1/3, *args)
+    k3 = h * f(x_old + 2*h/5, y_old + (4*k1 + 6*k2)/25, *args)
+    k4 = h * f(x_old + h, y_old + (k1 - 12*k2 + 15*k3)/4, *args)
+    k5 = h * f(x_old + 2*h/3, y_old + (6*k1 + 90*k2 - 50*k3 + 8*k4)/81, *args)
+    k6 = h * f(x_old + 4*h/5, y_old + (6*k1 + 36*k2 + 10*k3 + 8*k4)/75, *args)
+    # Actualización del valor de y según la fórmula del método RK6
+    return y_old + (23*k1 + 125*k3 - 81*k5 + 125*k6)/192
+
+# Implementación del método de Runge-Kutta de orden 6.
+# Cada etapa es una sola evaluación de f sobre todo el lote de trayectorias
+def runge_kutta_6(a, b, y0, m, f=f, args=(), densa=False):
     h = (b - a) / (m - 1)
     x_points = np.linspace(a, b, m)
-    y_points = np.zeros(m)
+    y0 = np.asarray(y0, dtype=float)
+    y_points = np.zeros((m,) + y0.shape)
+    # f(x_n, y_n), primera etapa de cada paso: solo se guarda para la salida densa
+    dy_points = np.zeros((m,) + y0.shape) if densa else None
     y_points[0] = y0
 
     for n in range(1, m):
-        
-        x_old = x_points[n - 1]
-        y_old = y_points[n - 1]
-        # Cálculo de los coeficientes intermedios
-        k1 = h * f(x_old, y_old)
-        k2 = h * f(x_old + h/3, y_old + k1/3)
-        k3 = h * f(x_old + 2*h/5, y_old + (4*k1 + 6*k2)/25)
-        k4 = h * f(x_old + h, y_old + (k1 - 12*k2 + 15*k3)/4)
-        k5 = h * f(x_old + 2*h/3, y_old + (6*k1 + 90*k2 - 50*k3 + 8*k4)/81)
-        k6 = h * f(x_old + 4*h/5, y_old + (6*k1 + 36*k2 + 10*k3 + 8*k4)/75)
-         # Actualización del valor de y según la fórmula del método RK6
-        y_points[n] = y_old + (23*k1 + 125*k2 - 81*k5 + 125*k6)/192
-
-    return x_points, y_points
+        f0 = f(x_points[n - 1], y_points[n - 1], *args)
+        if densa:
+            dy_points[n - 1] = f0
+        y_points[n] = paso_rk6(f, x_points[n - 1], y_points[n - 1], h, args, f0)
+
+    if not densa:
+        return x_points, y_points
+    dy_points[-1] = f(x_points[-1], y_points[-1], *args)
+    return x_points, y_points, SalidaDensa(x_points, y_points, dy_points)
+
+# Runge-Kutta con control adaptativo del paso por duplicación de paso:
+# se compara un paso h con dos pasos h/2. Como el método es de orden 5, la
+# diferencia entre ambos dividida entre 2^5 - 1 estima el error local, que se
+# suma a la solución fina (extrapolación local). El paso se acepta si
+# |error| <= atol + rtol*|y| en todas las componentes del lote. Con b < a se
+# integra hacia atrás (h es la magnitud del paso y avanza en el sentido de b - a).
+def runge_kutta_6_adaptativo(a, b, y0, f=f, args=(), rtol=1e-8, atol=1e-10,
+                             h0=None, h_min=1e-12, max_pasos=100_000, densa=False):
+    y = np.asarray(y0, dtype=float)
+    x = a
+    sentido = np.sign(b - a)  # +1 hacia adelante, -1 hacia atrás
+    h = abs(h0) if h0 is not None else abs(b - a) / 100
+    x_points = [x]
+    y_points = [y]
+    dy_points = []
+    evaluaciones = 0
+    rechazados = 0
+
+    while sentido * (b - x) > 0:
+        if len(x_points) > max_pasos:
+            raise RuntimeError(f"Se superó el máximo de {max_pasos} pasos")
+        if h < h_min:
+            raise RuntimeError(f"El paso h = {h:.3e} es menor que h_min en x = {x}")
+        h = min(h, sentido * (b - x))  # El último paso termina exactamente en b
+        hs = sentido * h
+
+        f0 = f(x, y, *args)  # Compartido por el paso completo y el primer medio paso
+        dy_points.append(f0)
+        evaluaciones += 1
+        while True:
+            y_grueso = paso_rk6(f, x, y, hs, args, f0)
+            y_medio = paso_rk6(f, x, y, hs/2, args, f0)
+            y_fino = paso_rk6(f, x + hs/2, y_medio, hs/2, args)
+            evaluaciones += 16
+
+            error = (y_fino - y_grueso) / 31
+            y_nuevo = y_fino + error
+            escala = atol + rtol * np.maximum(np.abs(y), np.abs(y_nuevo))
+            e = np.max(np.abs(error) / escala)
+
+            # Factor de cambio del paso (el error local es O(h^6))
+            factor = 5.0 if e == 0 else min(5.0, max(0.2, 0.9 * e ** (-1/6)))
+            if e <= 1:
+                break
+            rechazados += 1
+            h *= factor
+            hs = sentido * h
+            if h < h_min:
+                raise RuntimeError(f"El paso h = {h:.3e} es menor que h_min en x = {x}")
+
+        x = b if sentido * (b - (x + hs)) < 1e-14 * abs(b) else x + hs
+        y = y_nuevo
+        x_points.append(x)
+        y_points.append(y)
+        h *= factor
+
+    info = {"evaluaciones": evaluaciones, "aceptados": len(x_points) - 1, "rechazados": rechazados}
+    if not densa:
+        return np.array(x_points), np.array(y_points), info
+    dy_points.append(f(x, y, *args))
+    info["evaluaciones"] += 1
+    densa = SalidaDensa(x_points, y_points, dy_points)
+    return np.array(x_points), np.array(y_points), info, densa
 # Solución exacta
 def exact_solution(x):
     return x * np.log(x / 2) + 2 * x
@@ -71,13 +220,44 @@ def exact_solution(x):
 if __name__ == "__main__":
 
     m_values = [10, 20, 50, 100, 250]
-    solutions = [runge_kutta_6(2, 10, 4, m) for m in m_values]
+    solutions = [runge_kutta_6(2, 10, 4, m, densa=True) for m in m_values]
+    # Estudio de Monte Carlo: 10^5 condiciones iniciales y(2) ~ N(4, 0.1^2)
+    # integradas a la vez (una evaluación de f por etapa para todo el lote)
+    y0_lote = np.random.default_rng(0).normal(4, 0.1, 100_000)
+    _, y_lote = runge_kutta_6(2, 10, y0_lote, 100)
+    print(f"Monte Carlo y(10): media = {y_lote[-1].mean():.6f}, desviación = {y_lote[-1].std():.6f}")
+
+    # Paso adaptativo contra malla uniforme: evaluaciones de f para cada precisión
+    print(f"{'rtol':>8} {'error máx.':>11} {'evals adapt.':>13} {'rechazos':>9} {'evals uniforme':>15}")
+    for rtol in [1e-4, 1e-6, 1e-8, 1e-10]:
+        x_ad, y_ad, info = runge_kutta_6_adaptativo(2, 10, 4, rtol=rtol, atol=rtol)
+        error = np.max(np.abs(y_ad - exact_solution(x_ad)))
+        # Menor malla uniforme que alcanza el mismo error (6 evaluaciones por paso):
+        # se duplica m hasta cumplirlo y luego se busca por bisección entre m/2 y m
+        def cumple(m):
+            return np.max(np.abs(runge_kutta_6(2, 10, 4, m)[1] - exact_solution(np.linspace(2, 10, m)))) <= error
+        m = 2
+        while not cumple(m):
+            m *= 2
+        lo = max(m // 2, 2)
+        while lo < m:
+            medio = (lo + m) // 2
+            if cumple(medio):
+                m = medio
+            else:
+                lo = medio + 1
+        print(f"{rtol:>8.0e} {error:>11.2e} {info['evaluaciones']:>13} {info['rechazados']:>9} {6 * (m - 1):>15}")
+
     # Solución exacta evaluada en muchos puntos
     x_exact = np.linspace(2, 10, 1000)
     y_exact = exact_solution(x_exact)
-    # Graficar cada solución numérica obtenida
-    for (x, y), m in zip(solutions, m_values):
-        plt.plot(x, y, label=f'RK6 m={m}')
+    # Graficar cada solución numérica con su salida densa en los mismos puntos
+    for (x, y, densa), m in zip(solutions, m_values):
+        plt.plot(x_exact, densa(x_exact), label=f'RK6 m={m}')
+
+    # Evento sobre el interpolante: x donde y(x) = 20
+    _, _, densa = solutions[-1]
+    print("y(x) = 20 en x =", densa.eventos(lambda x, y: y - 20))
     # Graficar la solución analítica
     plt.plot(x_exact, y_exact, 'k--', label='Solución exacta')
     plt.title("Runge-Kutta 6to orden vs Solución Exacta")
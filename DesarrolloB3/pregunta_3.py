@@ -1,6 +1,9 @@
-import sympy as sp
 import numpy as np
 import matplotlib.pyplot as plt
+try:
+    import sympy as sp
+except ImportError:   # sympy solo se usa para imprimir el polinomio
+    sp = None
 """
 Estudiantes:
 Ana Melissa Vásquez Rojas
@@ -60,40 +63,215 @@ def polinomio_lagrange(x_val, y_val):
     return sp.simplify(p_x)
 
 
-# Datos obtenidos con h=1
-x_val = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
-y_val = [1.00000000, 0.69696245, -0.00758192, -0.50450963, -0.44956304, 0.00000000]
+# Forma baricéntrica del polinomio de Lagrange
+# P(x) = sum_k w_k y_k / (x - x_k) / sum_k w_k / (x - x_k),  w_k = 1 / prod_{j != k} (x_k - x_j)
+class InterpoladorBaricentrico:
+    """
+    Interpolador de Lagrange numérico en forma baricéntrica.
+
+    Los pesos se calculan una sola vez en O(n^2); evaluar en M puntos cuesta
+    O(nM) sin bucles de Python y agregar un nodo cuesta O(n).
+
+    Args:
+        x_val (np.array): Nodos x_i (distintos).
+        y_val (np.array): Valores y_i = f(x_i).
+    """
+
+    def __init__(self, x_val, y_val):
+        self.x = np.asarray(x_val, dtype=float).copy()
+        self.y = np.asarray(y_val, dtype=float).copy()
+        if len(self.x) != len(self.y):
+            raise ValueError("x_val y y_val deben tener la misma longitud")
+        if len(np.unique(self.x)) != len(self.x):
+            raise ValueError("Los nodos de interpolación deben ser distintos")
+
+        dif = self.x[:, None] - self.x[None, :]
+        np.fill_diagonal(dif, 1.0)
+        self.w = 1 / np.prod(dif, axis=1)
+
+    def agregar_nodo(self, xn, yn):
+        """
+        Agrega el nodo (xn, yn) actualizando los pesos en O(n).
+
+        Args:
+            xn (float): Nuevo nodo (distinto de los anteriores).
+            yn (float): Valor de la función en xn.
+        """
+        dif = self.x - xn
+        if np.any(dif == 0):
+            raise ValueError(f"El nodo {xn} ya está en el interpolador")
+        self.w = np.append(self.w / dif, 1 / np.prod(-dif))
+        self.x = np.append(self.x, xn)
+        self.y = np.append(self.y, yn)
+
+    def __call__(self, xq):
+        """
+        Evalúa el polinomio de interpolación.
+
+        Args:
+            xq (float o np.array): Punto(s) de evaluación.
+
+        Returns:
+            float o np.array: P(xq).
+        """
+        xq = np.asarray(xq, dtype=float)
+        t = xq.reshape(-1)
+        dif = t[:, None] - self.x[None, :]
+        exacto = dif == 0
+        dif[exacto] = 1.0       # se corrige abajo con el valor del nodo
+        c = self.w / dif
+        P = (c @ self.y) / c.sum(axis=1)
+
+        fila, col = np.nonzero(exacto)
+        P[fila] = self.y[col]
+        return P.reshape(xq.shape) if xq.ndim else float(P[0])
+
+
+def puntos_chebyshev(n, a=-1.0, b=1.0):
+    """
+    Puntos de Chebyshev (extremos) x_j = cos(pi j / n), j = 0, ..., n, llevados a [a, b].
+
+    Args:
+        n (int): Grado (se generan n+1 puntos).
+        a, b (float): Extremos del intervalo.
+
+    Returns:
+        np.array: Puntos en orden decreciente (de b a a).
+    """
+    return (a + b) / 2 + (b - a) / 2 * np.cos(np.pi * np.arange(n + 1) / n)
+
+
+def coeficientes_chebyshev(valores):
+    """
+    Coeficientes de la serie de Chebyshev que interpola valores dados en puntos_chebyshev.
+
+    Se calculan con la FFT de la extensión par de los datos (DCT tipo I) en O(n log n).
+
+    Args:
+        valores (np.array): f(x_j) en los n+1 puntos de Chebyshev.
+
+    Returns:
+        np.array: Coeficientes c_0, ..., c_n de P(x) = sum_k c_k T_k(x).
+    """
+    v = np.asarray(valores, dtype=float)
+    n = len(v) - 1
+    if n == 0:
+        return v.copy()
+    c = np.fft.rfft(np.concatenate((v, v[-2:0:-1]))).real[:n + 1] / n
+    c[0] /= 2
+    c[n] /= 2
+    return c
+
+
+class SerieChebyshev:
+    """
+    Aproximación P(x) = sum_k c_k T_k(t), t = (2x - a - b) / (b - a), en [a, b].
+
+    Se evalúa con el algoritmo de Clenshaw, vectorizado sobre los puntos.
+
+    Args:
+        coef (np.array): Coeficientes c_0, ..., c_n.
+        a, b (float): Intervalo de la aproximación.
+    """
+
+    def __init__(self, coef, a=-1.0, b=1.0):
+        self.coef = np.asarray(coef, dtype=float)
+        self.a = a
+        self.b = b
+
+    @property
+    def grado(self):
+        return len(self.coef) - 1
+
+    def __call__(self, xq):
+        xq = np.asarray(xq, dtype=float)
+        t = (2 * xq - self.a - self.b) / (self.b - self.a)
+        b1 = np.zeros_like(t)
+        b2 = np.zeros_like(t)
+        for ck in self.coef[:0:-1]:
+            b1, b2 = 2 * t * b1 - b2 + ck, b1
+        P = t * b1 - b2 + self.coef[0]
+        return P if P.ndim else float(P)
+
+
+def interpolar_chebyshev(f, a, b, tol=1e-14, n_inicial=16, n_max=2**16):
+    """
+    Interpola f en [a, b] con puntos de Chebyshev aumentando el grado de forma adaptativa.
+
+    El grado se duplica (reutilizando las muestras anteriores, pues los puntos
+    de grado 2n contienen a los de grado n) hasta que los últimos coeficientes
+    caen por debajo de tol relativo al mayor; luego se recorta la cola.
+
+    Args:
+        f (callable): Función vectorizada a aproximar (p. ej. y_exacta).
+        a, b (float): Intervalo.
+        tol (float): Tolerancia relativa sobre los coeficientes.
+        n_inicial (int): Grado inicial.
+        n_max (int): Grado máximo permitido.
+
+    Returns:
+        SerieChebyshev: Aproximación compacta de f.
+    """
+    n = n_inicial
+    valores = np.asarray(f(puntos_chebyshev(n, a, b)), dtype=float)
+    while True:
+        c = coeficientes_chebyshev(valores)
+        escala = np.max(np.abs(c))
+        if escala == 0:
+            return SerieChebyshev(c[:1], a, b)
+        if np.max(np.abs(c[-3:])) <= tol * escala:
+            grande = np.flatnonzero(np.abs(c) > tol * escala)
+            return SerieChebyshev(c[:grande[-1] + 1], a, b)
+        if 2 * n > n_max:
+            raise ValueError(f"Los coeficientes no decaen por debajo de {tol} con grado {n_max}")
+
+        # Los puntos nuevos son los de índice impar en la malla de grado 2n
+        nuevos = np.asarray(f(puntos_chebyshev(2 * n, a, b)[1::2]), dtype=float)
+        todos = np.empty(2 * n + 1)
+        todos[::2] = valores
+        todos[1::2] = nuevos
+        valores = todos
+        n *= 2
+
 
-# Cálculo del polinomio de interpolación simbólico de Lagrange
+if __name__ == "__main__":
+    # Datos obtenidos con h=1
+    x_val = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    y_val = [1.00000000, 0.69696245, -0.00758192, -0.50450963, -0.44956304, 0.00000000]
 
-P_sym = polinomio_lagrange(x_val, y_val)
+    # Interpolador numérico (forma baricéntrica)
+    Px = InterpoladorBaricentrico(x_val, y_val)
 
-# Imprimir el polinomio simbólico simplificado
-print("\nPolinomio de interpolación de Lagrange simplificado:")
-print("P(x) =", str(P_sym))
+    # El polinomio simbólico solo se construye para imprimirlo (requiere sympy)
+    if sp is not None:
+        P_sym = polinomio_lagrange(x_val, y_val)
+        print("\nPolinomio de interpolación de Lagrange simplificado:")
+        print("P(x) =", str(P_sym))
 
-# Conversión del polinomio simbólico a función numérica evaluable
-Px = sp.lambdify(sp.Symbol('x'), P_sym, 'numpy')
+    # Gráfico: función exacta, puntos dados e interpolación
+    x_plot = np.linspace(1, 6, 800)
 
-# Gráfico: función exacta, puntos dados e interpolación
-x_plot = np.linspace(1, 6, 800)
+    # Aproximación de Chebyshev de grado adaptativo de la función exacta
+    Pc = interpolar_chebyshev(y_exacta, 1, 6)
+    print(f"\nChebyshev: grado {Pc.grado}, error máx. "
+          f"{np.max(np.abs(Pc(x_plot) - y_exacta(x_plot))):.3e}")
 
-plt.figure(figsize=(9, 6))
+    plt.figure(figsize=(9, 6))
 
-# Curva del polinomio de Lagrange
-plt.plot(x_plot, Px(x_plot), label='Polinomio de Lagrange', color='blue')
+    # Curva del polinomio de Lagrange
+    plt.plot(x_plot, Px(x_plot), label='Polinomio de Lagrange', color='blue')
 
-# Puntos dados
-plt.plot(x_val, y_val, 'ko', label='Puntos dados (h = 1)', markersize=6)
+    # Puntos dados
+    plt.plot(x_val, y_val, 'ko', label='Puntos dados (h = 1)', markersize=6)
 
-# Curva de la función exacta
-plt.plot(x_plot, y_exacta(x_plot), '--', label='f(x) exacta', linewidth=2, color='green')
+    # Curva de la función exacta
+    plt.plot(x_plot, y_exacta(x_plot), '--', label='f(x) exacta', linewidth=2, color='green')
 
-# Configuración del gráfico
-plt.title("Interpolación de Lagrange vs. función exacta")
-plt.xlabel("x")
-plt.ylabel("y(x)")
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
+    # Configuración del gráfico
+    plt.title("Interpolación de Lagrange vs. función exacta")
+    plt.xlabel("x")
+    plt.ylabel("y(x)")
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    plt.show()
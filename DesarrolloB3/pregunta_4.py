@@ -1,47 +1,316 @@
 import numpy as np
-import sympy as sp
 import matplotlib.pyplot as plt
+try:
+    import sympy as sp
+except ImportError:   # sympy solo se usa para imprimir los trazadores
+    sp = None
+from tridiagonal import factorizar_thomas, resolver_factorizado, thomas_bandas, thomas_ciclico
 """
 Estudiantes:
 Ana Melissa Vásquez Rojas
 Daniel Duarte Cordero
 """
 
-def thomas(A, d):
+def coeficientes_trazador(x_val, y_val, frontera="natural", pendientes=(0.0, 0.0)):
     """
-    Resuelve un sistema tridiagonal de ecuaciones lineales usando el metodo de Thomas.
+    Calcula los coeficientes del trazador cúbico con operaciones de arreglos.
+
+    Las incógnitas son los momentos m_j = s''(x_j); cada renglón interior cumple
+        h_{j-1} m_{j-1} + 2 (h_{j-1} + h_j) m_j + h_j m_{j+1} = 6 (delta_j - delta_{j-1}),
+    con delta_j = (y_{j+1} - y_j) / h_j, y el sistema se resuelve por bandas en O(n).
 
     Args:
-        A (np.array): Matriz tridiagonal del sistema (n x n).
-        d (np.array): Vector del lado derecho (n).
+        x_val (np.array): Coordenadas x de los puntos de interpolación (crecientes).
+        y_val (np.array): Coordenadas y (n) o varias columnas que comparten los nodos (n x k).
+        frontera (str): "natural" (m_0 = m_{n-1} = 0), "sujeta" (s' dada en los extremos),
+            "not-a-knot" (tercera derivada continua en x_1 y x_{n-2}) o "periodica"
+            (requiere y_0 = y_{n-1}).
+        pendientes (tuple): Valores (s'(x_0), s'(x_{n-1})) para frontera "sujeta".
 
     Returns:
-        np.array: Solución del sistema (vector x).
+        tuple: Arreglos (a, b, c, d) de tamaño n-1 (o (n-1) x k) con
+        s_j(x) = a_j (x - x_j)^3 + b_j (x - x_j)^2 + c_j (x - x_j) + d_j.
+    """
+    x_val = np.asarray(x_val, dtype=float)
+    y_val = np.asarray(y_val, dtype=float)
+    n = len(x_val)
+    if y_val.shape[0] != n:
+        raise ValueError("x_val y y_val deben tener el mismo número de puntos")
+    minimo = {"natural": 3, "sujeta": 2, "not-a-knot": 4, "periodica": 4}
+    if frontera not in minimo:
+        raise ValueError(f"Condición de frontera desconocida: {frontera}")
+    if n < minimo[frontera]:
+        raise ValueError(f"La frontera {frontera} necesita al menos {minimo[frontera]} puntos")
+
+    # Paso 1: h_j = x_{j+1} - x_j y pendientes delta_j (las columnas de y se tratan juntas)
+    h = np.diff(x_val)
+    if np.any(h <= 0):
+        raise ValueError("Los nodos deben ser estrictamente crecientes")
+    hc = h.reshape((-1,) + (1,) * (y_val.ndim - 1))
+    delta = np.diff(y_val, axis=0) / hc
+
+    # Paso 2: bandas del sistema para los momentos interiores m_1, ..., m_{n-2}
+    sub = h[1:-1].copy()              # A[j, j-1] = h[j]
+    diag = 2 * (h[:-1] + h[1:])       # Diagonal principal
+    sup = h[1:-1].copy()              # A[j, j+1] = h[j+1]
+    u = 6 * (delta[1:] - delta[:-1])  # Lado derecho
+
+    # Paso 2.5: condiciones de frontera y solución por el método de Thomas
+    m = np.zeros(y_val.shape)
+    if frontera == "natural":
+        m[1:-1] = resolver_factorizado(factorizar_thomas(sub, diag, sup), u)
+
+    elif frontera == "sujeta":
+        # Se agregan los renglones de m_0 y m_{n-1}:
+        # 2 h_0 m_0 + h_0 m_1 = 6 (delta_0 - s'_0),  h_{n-2} m_{n-2} + 2 h_{n-2} m_{n-1} = 6 (s'_n - delta_{n-2})
+        izq, der = pendientes
+        diag = np.concatenate(([2 * h[0]], diag, [2 * h[-1]]))
+        u = np.concatenate(([6 * (delta[0] - izq)], u, [6 * (der - delta[-1])]))
+        m[:] = resolver_factorizado(factorizar_thomas(h, diag, h), u)
+
+    elif frontera == "not-a-knot":
+        # m_0 = ((h_0 + h_1) m_1 - h_0 m_2) / h_1 se sustituye en el primer renglón
+        # (y de forma simétrica m_{n-1} en el último), así el sistema sigue siendo tridiagonal
+        h0, h1 = h[0], h[1]
+        diag[0] += h0 * (h0 + h1) / h1
+        sup[0] -= h0**2 / h1
+        p, q = h[-2], h[-1]
+        diag[-1] += q * (p + q) / p
+        sub[-1] -= q**2 / p
+        m[1:-1] = resolver_factorizado(factorizar_thomas(sub, diag, sup), u)
+        m[0] = ((h0 + h1) * m[1] - h0 * m[2]) / h1
+        m[-1] = ((p + q) * m[-2] - q * m[-3]) / p
+
+    else:
+        # Periódica: m_{n-1} = m_0 y el renglón 0 usa h_{n-2} y delta_{n-2} (sistema cíclico)
+        if not np.allclose(y_val[0], y_val[-1]):
+            raise ValueError("La frontera periódica requiere y_0 = y_{n-1}")
+        diag = np.concatenate(([2 * (h[-1] + h[0])], diag))
+        u = np.concatenate(([6 * (delta[0] - delta[-1])], u))
+        m[:-1] = thomas_ciclico(h[:-1], diag, h[:-1], u, alfa=h[-1], beta=h[-1])
+        m[-1] = m[0]
+
+    # Paso 3: coeficientes a_j, b_j, c_j, d_j para j = 0,...,n-2
+    a = (m[1:] - m[:-1]) / (6 * hc)
+    b = m[:-1] / 2
+    c = delta - hc / 6 * (2 * m[:-1] + m[1:])
+    d = y_val[:-1].copy()
+
+    return a, b, c, d
+
+
+class Trazador:
     """
-    n = len(d)
-    a = np.diag(A, -1)  # Subdiagonal
-    b = np.diag(A, 0)  # Diagonal principal
-    c = np.diag(A, 1)  # Superdiagonal
+    Trazador cúbico numérico que guarda los arreglos de coeficientes.
 
-    p = np.zeros(n - 1)
-    q = np.zeros(n)
+    Cada evaluación ubica el tramo de todos los puntos con una sola búsqueda
+    binaria (np.searchsorted) y evalúa el polinomio con Horner vectorizado.
+    Fuera de [x_0, x_{n-1}] se extrapola con el primer o el último tramo.
+    Si los coeficientes tienen varias columnas (n-1 x k), cada evaluación
+    retorna los k trazadores a la vez (forma xq.shape + (k,)).
 
-    p[0] = c[0] / b[0]
-    q[0] = d[0] / b[0]
+    Args:
+        x_val (np.array): Nodos crecientes x_0, ..., x_{n-1}.
+        a, b, c, d (np.array): Coeficientes de cada tramo (n-1 o n-1 x k).
+    """
 
-    for i in range(1, n - 1):
-        denom = b[i] - a[i - 1] * p[i - 1]
-        p[i] = c[i] / denom
-        q[i] = (d[i] - a[i - 1] * q[i - 1]) / denom
+    def __init__(self, x_val, a, b, c, d):
+        self.x = np.asarray(x_val, dtype=float)
+        self.a, self.b, self.c, self.d = (np.asarray(v, dtype=float) for v in (a, b, c, d))
+        # Integral de cada tramo completo y su acumulado desde x_0
+        h = np.diff(self.x).reshape((-1,) + (1,) * (self.a.ndim - 1))
+        tramos = ((self.a * h / 4 + self.b / 3) * h + self.c / 2) * h**2 + self.d * h
+        self._acumulada = np.concatenate((np.zeros((1,) + tramos.shape[1:]), np.cumsum(tramos, axis=0)))
+
+    def _tramo(self, xq):
+        xq = np.asarray(xq, dtype=float)
+        j = np.clip(np.searchsorted(self.x, xq, side="right") - 1, 0, len(self.x) - 2)
+        t = xq - self.x[j]
+        return xq, j, t.reshape(t.shape + (1,) * (self.a.ndim - 1))
+
+    def __call__(self, xq, derivada=0):
+        """
+        Evalúa el trazador o una de sus derivadas.
+
+        Args:
+            xq (float o np.array): Punto(s) de evaluación.
+            derivada (int): Orden de la derivada (0 a 3).
+
+        Returns:
+            float o np.array: s(xq) o s^(derivada)(xq).
+        """
+        xq, j, t = self._tramo(xq)
+        a, b, c, d = self.a[j], self.b[j], self.c[j], self.d[j]
+        if derivada == 0:
+            s = ((a * t + b) * t + c) * t + d
+        elif derivada == 1:
+            s = (3 * a * t + 2 * b) * t + c
+        elif derivada == 2:
+            s = 6 * a * t + 2 * b
+        elif derivada == 3:
+            s = 6 * a + 0 * t
+        else:
+            s = 0 * t
+        return s if np.ndim(s) else float(s)
+
+    def derivada(self, xq, orden=1):
+        """
+        Evalúa la derivada de orden dado del trazador (ver __call__).
+        """
+        return self(xq, derivada=orden)
+
+    def integral(self, x0, x1=None):
+        """
+        Evalúa la integral del trazador.
+
+        Args:
+            x0 (float o np.array): Límite inferior, o superior si x1 es None.
+            x1 (float o np.array): Límite superior.
+
+        Returns:
+            float o np.array: Integral de x0 a x1, o de x_0 a x0 si x1 es None.
+        """
+        if x1 is None:
+            xq, j, t = self._tramo(x0)
+            a, b, c, d = self.a[j], self.b[j], self.c[j], self.d[j]
+            s = self._acumulada[j] + (((a * t / 4 + b / 3) * t + c / 2) * t + d) * t
+            return s if np.ndim(s) else float(s)
+        return self.integral(x1) - self.integral(x0)
+
+
+def trazador_cubico_numerico(x_val, y_val, frontera="natural", pendientes=(0.0, 0.0)):
+    """
+    Construye el trazador cúbico como objeto numérico evaluable.
 
-    q[n - 1] = (d[n - 1] - a[n - 2] * q[n - 2]) / (b[n - 1] - a[n - 2] * p[n - 2])
+    Args:
+        x_val (np.array): Coordenadas x de los puntos de interpolación.
+        y_val (np.array): Coordenadas y (n) o varias columnas (n x k).
+        frontera (str): "natural", "sujeta", "not-a-knot" o "periodica" (ver coeficientes_trazador).
+        pendientes (tuple): (s'(x_0), s'(x_{n-1})) para frontera "sujeta".
 
-    x = np.zeros(n)
-    x[n - 1] = q[n - 1]
-    for i in range(n - 2, -1, -1):
-        x[i] = q[i] - p[i] * x[i + 1]
+    Returns:
+        Trazador: Objeto con los coeficientes; se evalúa como s(x), s(x, derivada=k), s.integral(a, b).
+    """
+    return Trazador(x_val, *coeficientes_trazador(x_val, y_val, frontera, pendientes))
 
-    return x
+
+class TrazadorIncremental:
+    """
+    Trazador cúbico natural para datos que llegan como un flujo de muestras (x, y).
+
+    Al agregar un nodo solo se vuelve a resolver el tramo final del sistema de
+    momentos: las últimas `recalculo` incógnitas, con el momento anterior a ese
+    tramo fijo y m = 0 en el último nodo. El efecto de un nodo nuevo sobre los
+    momentos decae geométricamente hacia atrás (≈ 0.27 por nodo en mallas
+    uniformes), así que el error de no actualizar los momentos más viejos es
+    del orden de 0.27^recalculo. Se evalúa sobre los últimos `ventana` nodos
+    (en memoria hay a lo sumo 2*ventana), así que la memoria y el costo por
+    muestra son constantes.
+
+    Args:
+        ventana (int): Número de nodos que se conservan para evaluar.
+        recalculo (int): Número de momentos finales que se recalculan en cada muestra.
+    """
+
+    def __init__(self, ventana=1000, recalculo=32):
+        if ventana < 3 or recalculo < 1:
+            raise ValueError("Se necesita ventana >= 3 y recalculo >= 1")
+        self.ventana = ventana
+        self.recalculo = min(recalculo, ventana - 2)
+        # Memoria de 2*ventana: al llenarse se copian los últimos nodos al inicio
+        self._x = np.empty(2 * ventana)
+        self._y = np.empty(2 * ventana)
+        self._m = np.zeros(2 * ventana)
+        self._n = 0
+
+    @property
+    def x(self):
+        return self._x[max(0, self._n - self.ventana):self._n]
+
+    @property
+    def y(self):
+        return self._y[max(0, self._n - self.ventana):self._n]
+
+    @property
+    def m(self):
+        return self._m[max(0, self._n - self.ventana):self._n]
+
+    def agregar(self, xn, yn):
+        """
+        Agrega una muestra y actualiza el final del trazador en tiempo constante.
+
+        Args:
+            xn (float): Nuevo nodo, mayor que el último agregado.
+            yn (float): Valor de la muestra.
+        """
+        if self._n and xn <= self._x[self._n - 1]:
+            raise ValueError("Los nodos deben llegar en orden estrictamente creciente")
+        if self._n == len(self._x):
+            conservar = self.ventana - 1
+            for arreglo in (self._x, self._y, self._m):
+                arreglo[:conservar] = arreglo[self._n - conservar:self._n]
+            self._n = conservar
+
+        n = self._n
+        self._x[n], self._y[n], self._m[n] = xn, yn, 0.0
+        self._n = n = n + 1
+        if n < 3:
+            return
+
+        # Incógnitas m_i para i = lo+1, ..., n-2 con m_lo fijo y m_{n-1} = 0
+        lo = max(0, n - 2 - self.recalculo)
+        x = self._x[lo:n]
+        y = self._y[lo:n]
+        h = np.diff(x)
+        delta = np.diff(y) / h
+        u = 6 * (delta[1:] - delta[:-1])
+        u[0] -= h[0] * self._m[lo]
+        self._m[lo + 1:n - 1] = thomas_bandas(h[1:-1], 2 * (h[:-1] + h[1:]), h[1:-1], u)
+
+    def agregar_lote(self, xs, ys):
+        """
+        Agrega varias muestras en orden.
+
+        Args:
+            xs, ys (np.array): Nodos crecientes y sus valores.
+        """
+        for xn, yn in zip(xs, ys):
+            self.agregar(xn, yn)
+
+    def __call__(self, xq):
+        """
+        Evalúa el trazador en la ventana actual a partir de los momentos.
+
+        Args:
+            xq (float o np.array): Punto(s) de evaluación (dentro de la ventana).
+
+        Returns:
+            float o np.array: s(xq).
+        """
+        if self._n < 2:
+            raise ValueError("Se necesitan al menos dos muestras para evaluar")
+        x, y, m = self.x, self.y, self.m
+        xq = np.asarray(xq, dtype=float)
+        j = np.clip(np.searchsorted(x, xq, side="right") - 1, 0, len(x) - 2)
+        h = x[j + 1] - x[j]
+        izq = x[j + 1] - xq
+        der = xq - x[j]
+        s = ((m[j] * izq**3 + m[j + 1] * der**3) / (6 * h)
+             + (y[j] / h - m[j] * h / 6) * izq + (y[j + 1] / h - m[j + 1] * h / 6) * der)
+        return s if s.ndim else float(s)
+
+    def trazador(self):
+        """
+        Retorna un Trazador con los coeficientes de la ventana actual (para derivadas e integrales).
+
+        Returns:
+            Trazador: Copia de la ventana actual.
+        """
+        x, y, m = self.x.copy(), self.y.copy(), self.m.copy()
+        h = np.diff(x)
+        a = (m[1:] - m[:-1]) / (6 * h)
+        c = np.diff(y) / h - h / 6 * (2 * m[:-1] + m[1:])
+        return Trazador(x, a, m[:-1] / 2, c, y[:-1])
 
 
 def trazador_cubico(x_val, y_val):
@@ -56,46 +325,7 @@ def trazador_cubico(x_val, y_val):
         tuple: Lista de funciones simbólicas de los trazadores y el símbolo simbólico x.
     """
     n = len(x_val)
-
-    # Paso 1: Calcular h_j = x_{j+1} - x_j para j = 0,...,n-2
-    h = np.zeros(n - 1)
-    for j in range(n - 1):
-        h[j] = x_val[j + 1] - x_val[j]
-
-    # Paso 2: Construcción del sistema lineal A·m = u
-    A = np.zeros((n - 2, n - 2))    # A: Matriz tridiagonal de tamaño (n-2) x (n-2)
-    u = np.zeros(n - 2)          # Vector lado derecho con valores u_j
-
-    for j in range(n - 2):
-        # Diagonal principal
-        A[j, j] = 2 * (h[j] + h[j + 1])
-        # Subdiagonal
-        if j > 0:
-            A[j, j - 1] = h[j]
-        # Diagonal superior
-        if j < n - 3:
-            A[j, j + 1] = h[j + 1]
-        # Vector u
-        u[j] = 6 * ((y_val[j + 2] - y_val[j + 1]) / h[j + 1] - (y_val[j + 1] - y_val[j]) / h[j])
-
-    # Paso 2.5: Resolver el sistema tridiagonal con el metodo de Thomas
-    # m_0 = m_n = 0
-    m_interna = thomas(A, u)  # Soluciona el sistema para m_1 a m_{n-1}
-    m = np.zeros(n)
-    for j in range(1, n - 1):
-        m[j] = m_interna[j - 1]
-
-    # Paso 3: Calcular coeficientes a_j, b_j, c_j, d_j para j = 0,...,n-2
-    a = np.zeros(n - 1)
-    b = np.zeros(n - 1)
-    c = np.zeros(n - 1)
-    d = np.zeros(n - 1)
-
-    for j in range(n - 1):
-        a[j] = (m[j + 1] - m[j]) / (6 * h[j])
-        b[j] = m[j] / 2
-        c[j] = (y_val[j + 1] - y_val[j]) / h[j] - (h[j] / 6) * (2 * m[j] + m[j + 1])
-        d[j] = y_val[j]
+    a, b, c, d = coeficientes_trazador(x_val, y_val)
 
     # Paso 4: Construcción simbólica de cada trazador cúbico s_j(x)
     # s_j(x) = a_j*(x - x_j)^3 + b_j*(x - x_j)^2 + c_j*(x - x_j) + d_j
@@ -128,13 +358,15 @@ if __name__ == "__main__":
     x_val = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
     y_val = np.array([1.0, 0.69696245, -0.00758192, -0.50450963, -0.44956304, 0.0])
 
-    # Obtener funciones simbólicas de los trazadores
-    trazador, x_sym = trazador_cubico(x_val, y_val)
+    # Trazador numérico para evaluar y graficar
+    s = trazador_cubico_numerico(x_val, y_val)
 
-    # Imprimir funciones simbólicas
-    print("Trazadores cúbicos por tramos:")
-    for j in range(len(trazador)):
-        print(f"s_{j}(x) = {trazador[j]}")
+    # Imprimir funciones simbólicas (requiere sympy)
+    if sp is not None:
+        trazador, x_sym = trazador_cubico(x_val, y_val)
+        print("Trazadores cúbicos por tramos:")
+        for j in range(len(trazador)):
+            print(f"s_{j}(x) = {trazador[j]}")
 
     # Graficar función original
     x_plot = np.linspace(x_val[0], x_val[-1], 1000)
@@ -143,11 +375,10 @@ if __name__ == "__main__":
     plt.figure(figsize=(8, 6))
     plt.plot(x_plot, y_real, 'k--', label="Función original")
 
-    # Graficar cada trazador en su intervalo
-    for j in range(len(trazador)):
-        f_j = sp.lambdify(x_sym, trazador[j], modules='numpy')
-        x_l= x_plot[(x_plot >= x_val[j]) & (x_plot <= x_val[j + 1])]
-        y_l = f_j(x_l)
+    # Graficar cada trazador en su intervalo (una sola evaluación para todos los puntos)
+    y_plot = s(x_plot)
+    cortes = np.searchsorted(x_plot, x_val[1:-1])
+    for j, (x_l, y_l) in enumerate(zip(np.split(x_plot, cortes), np.split(y_plot, cortes))):
         plt.plot(x_l, y_l, label=f"Trazador s_{j}(x)")
 
     plt.plot(x_val, y_val, 'ro', label="Puntos dados")
@@ -0,0 +1,441 @@
+import numpy as np
+
+# Motores opcionales para los barridos de Thomas: Numba (JIT) y SciPy (LAPACK).
+# Si no están instalados se usa el ciclo de Python.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    from scipy.linalg import solve_banded
+except ImportError:
+    solve_banded = None
+"""
+Solucionador de sistemas tridiagonales compartido por los scripts del bloque 3.
+
+El sistema se guarda solo por sus tres diagonales (memoria O(n)), de modo que
+nunca se construye la matriz densa n x n:
+
+    b[0] x[0] + c[0] x[1]                         = d[0]
+    a[i-1] x[i-1] + b[i] x[i] + c[i] x[i+1]       = d[i],   i = 1, ..., n-2
+    a[n-2] x[n-2] + b[n-1] x[n-1]                 = d[n-1]
+"""
+
+
+def _barrido_python(a, b, c, d):
+    # Barridos hacia adelante y hacia atrás de Thomas (n >= 2)
+    n = len(d)
+    p = np.zeros(n - 1)  # Coeficientes modificados
+    q = np.zeros(n)      # Términos independientes modificados
+
+    p[0] = c[0] / b[0]
+    q[0] = d[0] / b[0]
+
+    for i in range(1, n - 1):
+        denom = b[i] - a[i - 1] * p[i - 1]
+        p[i] = c[i] / denom
+        q[i] = (d[i] - a[i - 1] * q[i - 1]) / denom
+
+    q[n - 1] = (d[n - 1] - a[n - 2] * q[n - 2]) / (b[n - 1] - a[n - 2] * p[n - 2])
+
+    x = np.zeros(n)
+    x[n - 1] = q[n - 1]
+    for i in range(n - 2, -1, -1):
+        x[i] = q[i] - p[i] * x[i + 1]
+
+    return x
+
+
+def _barrido_scipy(a, b, c, d):
+    # LAPACK (gtsv) con pivoteo parcial: mismo resultado salvo redondeo
+    ab = np.zeros((3, len(d)))
+    ab[0, 1:] = c
+    ab[1] = b
+    ab[2, :-1] = a
+    return solve_banded((1, 1), ab, d, check_finite=False)
+
+
+# Mismo ciclo compilado con Numba: las operaciones se hacen en el mismo orden,
+# así que el resultado coincide con el de _barrido_python
+_barrido_numba = numba.njit(cache=True)(_barrido_python) if numba is not None else None
+
+MOTORES = {"python": _barrido_python}
+if solve_banded is not None:
+    MOTORES["scipy"] = _barrido_scipy
+if _barrido_numba is not None:
+    MOTORES["numba"] = _barrido_numba
+
+# Motor usado por defecto: el más rápido disponible
+MOTOR_PREDETERMINADO = "numba" if "numba" in MOTORES else "scipy" if "scipy" in MOTORES else "python"
+
+
+def thomas_bandas(a, b, c, d, motor=None):
+    """
+    Resuelve un sistema tridiagonal con el algoritmo de Thomas a partir de sus diagonales.
+
+    Args:
+        a (np.array): Subdiagonal (n-1).
+        b (np.array): Diagonal principal (n).
+        c (np.array): Superdiagonal (n-1).
+        d (np.array): Vector del lado derecho (n).
+        motor (str): "numba", "scipy" o "python". Si es None se usa MOTOR_PREDETERMINADO.
+
+    Returns:
+        np.array: Solución del sistema (vector x de tamaño n).
+    """
+    motor = motor or MOTOR_PREDETERMINADO
+    if motor not in MOTORES:
+        raise ValueError(f"Motor no disponible: {motor}. Opciones: {sorted(MOTORES)}")
+
+    a = np.ascontiguousarray(a, dtype=float)
+    b = np.ascontiguousarray(b, dtype=float)
+    c = np.ascontiguousarray(c, dtype=float)
+    d = np.ascontiguousarray(np.ravel(d), dtype=float)
+    n = len(d)
+
+    if len(b) != n or len(a) != n - 1 or len(c) != n - 1:
+        raise ValueError("Las diagonales no son compatibles con el tamaño del sistema")
+    if n == 1:
+        return d / b
+
+    return MOTORES[motor](a, b, c, d)
+
+
+def _barrido_multiple_python(a, b, c, D):
+    # Barrido de Thomas para k lados derechos (D de n x k): la eliminación se
+    # hace una sola vez por renglón y se aplica a las k columnas
+    n, k = D.shape
+    p = np.zeros(n - 1)
+    Q = np.zeros((n, k))
+    den = b[0]
+    for j in range(k):
+        Q[0, j] = D[0, j] / den
+    for i in range(1, n):
+        p[i - 1] = c[i - 1] / den
+        den = b[i] - a[i - 1] * p[i - 1]
+        for j in range(k):
+            Q[i, j] = (D[i, j] - a[i - 1] * Q[i - 1, j]) / den
+
+    X = np.zeros((n, k))
+    for j in range(k):
+        X[n - 1, j] = Q[n - 1, j]
+    for i in range(n - 2, -1, -1):
+        for j in range(k):
+            X[i, j] = Q[i, j] - p[i] * X[i + 1, j]
+    return X
+
+
+_barrido_multiple_numba = numba.njit(cache=True)(_barrido_multiple_python) if numba is not None else None
+
+
+def thomas_multiple(a, b, c, D):
+    """
+    Resuelve un sistema tridiagonal para varios lados derechos con una sola eliminación.
+
+    Usa el barrido compilado con Numba si está disponible; si no, SciPy
+    (solve_banded acepta varias columnas) o factorizar_thomas + resolver_factorizado.
+
+    Args:
+        a (np.array): Subdiagonal (n-1).
+        b (np.array): Diagonal principal (n).
+        c (np.array): Superdiagonal (n-1).
+        D (np.array): Bloque de k lados derechos (n x k).
+
+    Returns:
+        np.array: Soluciones (n x k).
+    """
+    a = np.ascontiguousarray(a, dtype=float)
+    b = np.ascontiguousarray(b, dtype=float)
+    c = np.ascontiguousarray(c, dtype=float)
+    D = np.ascontiguousarray(D, dtype=float)
+    n = len(b)
+
+    if D.ndim != 2 or D.shape[0] != n or len(a) != n - 1 or len(c) != n - 1:
+        raise ValueError("Las diagonales no son compatibles con el tamaño del sistema")
+    if n == 1:
+        return D / b[0]
+    if _barrido_multiple_numba is not None:
+        return _barrido_multiple_numba(a, b, c, D)
+    if solve_banded is not None:
+        return _barrido_scipy(a, b, c, D)
+    return resolver_factorizado(factorizar_thomas(a, b, c), D)
+
+
+def comparar_motores(n=100, repeticiones=10):
+    """
+    Compara tiempo y diferencia máxima de cada motor contra el ciclo de Python
+    en el sistema de matrix_generator (diagonal 5, vecinos 1, lado derecho -14/-12).
+
+    Args:
+        n (int): Tamaño del sistema.
+        repeticiones (int): Número de llamadas cronometradas por motor.
+    """
+    import time
+
+    a = np.ones(n - 1)
+    b = np.full(n, 5.0)
+    c = np.ones(n - 1)
+    d = np.full(n, -14.0)
+    d[0] = d[-1] = -12
+
+    referencia = thomas_bandas(a, b, c, d, motor="python")
+    for motor in sorted(MOTORES):
+        thomas_bandas(a, b, c, d, motor=motor)  # Compila (Numba) antes de medir
+        t0 = time.perf_counter()
+        for _ in range(repeticiones):
+            x = thomas_bandas(a, b, c, d, motor=motor)
+        t = (time.perf_counter() - t0) / repeticiones
+        print(f"{motor:>7}: {t * 1e6:10.1f} µs por solución, "
+              f"diferencia máx. {np.max(np.abs(x - referencia)):.1e}")
+
+
+def thomas_banda(ab, d):
+    """
+    Resuelve un sistema tridiagonal guardado como arreglo de bandas (3, n).
+
+    Usa el mismo formato que LAPACK / scipy.linalg.solve_banded((1, 1), ab, d):
+    ab[0, 1:] es la superdiagonal, ab[1, :] la diagonal principal y
+    ab[2, :-1] la subdiagonal (ab[0, 0] y ab[2, -1] no se usan).
+
+    Args:
+        ab (np.array): Bandas del sistema (3 x n).
+        d (np.array): Vector del lado derecho (n).
+
+    Returns:
+        np.array: Solución del sistema (vector x de tamaño n).
+    """
+    ab = np.asarray(ab, dtype=float)
+    if ab.ndim != 2 or ab.shape[0] != 3:
+        raise ValueError("Se espera un arreglo de bandas de forma (3, n)")
+    return thomas_bandas(ab[2, :-1], ab[1], ab[0, 1:], d)
+
+
+def factorizar_thomas(a, b, c):
+    """
+    Calcula una sola vez la parte del barrido hacia adelante que no depende del lado derecho.
+
+    Args:
+        a (np.array): Subdiagonal (n-1).
+        b (np.array): Diagonal principal (n).
+        c (np.array): Superdiagonal (n-1).
+
+    Returns:
+        tuple: (a, p, den) con la subdiagonal, los coeficientes modificados p (n-1)
+        y los denominadores den (n) del barrido, listos para resolver_factorizado.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    c = np.asarray(c, dtype=float)
+    n = len(b)
+
+    if len(a) != n - 1 or len(c) != n - 1:
+        raise ValueError("Las diagonales no son compatibles con el tamaño del sistema")
+
+    p = np.zeros(n - 1)
+    den = np.zeros(n)
+
+    den[0] = b[0]
+    for i in range(1, n):
+        p[i - 1] = c[i - 1] / den[i - 1]
+        den[i] = b[i] - a[i - 1] * p[i - 1]
+
+    return a, p, den
+
+
+def resolver_factorizado(factor, D):
+    """
+    Resuelve el sistema factorizado para uno o varios lados derechos.
+
+    Cada paso del barrido opera sobre una fila completa de D, así que las k
+    columnas se resuelven a la vez.
+
+    Args:
+        factor (tuple): Resultado de factorizar_thomas.
+        D (np.array): Lado derecho (n) o bloque de k lados derechos (n x k).
+
+    Returns:
+        np.array: Solución con la misma forma que D.
+    """
+    a, p, den = factor
+    D = np.asarray(D, dtype=float)
+    n = len(den)
+
+    if D.shape[0] != n:
+        raise ValueError("El lado derecho no es compatible con el tamaño del sistema")
+
+    q = np.empty_like(D)
+    q[0] = D[0] / den[0]
+    for i in range(1, n):
+        q[i] = (D[i] - a[i - 1] * q[i - 1]) / den[i]
+
+    x = np.empty_like(D)
+    x[n - 1] = q[n - 1]
+    for i in range(n - 2, -1, -1):
+        x[i] = q[i] - p[i] * x[i + 1]
+
+    return x
+
+
+def thomas_ciclico(a, b, c, d, alfa, beta):
+    """
+    Resuelve un sistema tridiagonal cíclico con Sherman-Morrison.
+
+    La matriz es tridiagonal salvo por A[n-1, 0] = alfa y A[0, n-1] = beta. Se
+    escribe como T + u v^T con T tridiagonal, se factoriza T una sola vez y se
+    resuelven a la vez T y = d y T z = u; entonces x = y - (v·y) / (1 + v·z) z.
+
+    Args:
+        a (np.array): Subdiagonal (n-1).
+        b (np.array): Diagonal principal (n), n >= 3.
+        c (np.array): Superdiagonal (n-1).
+        d (np.array): Lado derecho (n) o bloque de k lados derechos (n x k).
+        alfa (float): Esquina inferior izquierda A[n-1, 0].
+        beta (float): Esquina superior derecha A[0, n-1].
+
+    Returns:
+        np.array: Solución con la misma forma que d.
+    """
+    b = np.array(b, dtype=float)
+    d = np.asarray(d, dtype=float)
+    n = len(b)
+    if n < 3:
+        raise ValueError("El sistema cíclico necesita al menos 3 renglones")
+
+    gamma = -b[0]
+    b[0] -= gamma
+    b[-1] -= alfa * beta / gamma
+    u = np.zeros(n)
+    u[0], u[-1] = gamma, alfa
+
+    columnas = d.reshape(n, -1)
+    sol = resolver_factorizado(factorizar_thomas(a, b, c), np.column_stack((columnas, u)))
+    y, z = sol[:, :-1], sol[:, -1]
+
+    # v = (1, 0, ..., 0, beta / gamma)
+    vy = y[0] + beta / gamma * y[-1]
+    vz = z[0] + beta / gamma * z[-1]
+    x = y - np.outer(z, vy / (1 + vz))
+    return x.reshape(d.shape)
+
+
+def thomas_lote(a, b, c, d):
+    """
+    Resuelve N sistemas tridiagonales independientes del mismo tamaño.
+
+    El barrido recorre los n renglones y cada paso se aplica a los N sistemas
+    como una operación de arreglos.
+
+    Args:
+        a (np.array): Subdiagonales (N x n-1).
+        b (np.array): Diagonales principales (N x n).
+        c (np.array): Superdiagonales (N x n-1).
+        d (np.array): Lados derechos (N x n).
+
+    Returns:
+        np.array: Soluciones de los N sistemas (N x n).
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    c = np.asarray(c, dtype=float)
+    d = np.asarray(d, dtype=float)
+    N, n = d.shape
+
+    if b.shape != (N, n) or a.shape != (N, n - 1) or c.shape != (N, n - 1):
+        raise ValueError("Las diagonales no son compatibles con los lados derechos")
+
+    # Se trabaja con los renglones como primer eje para recorrer memoria contigua
+    a, b, c, d = a.T, b.T, c.T, d.T
+    p = np.empty((max(n - 1, 0), N))
+    q = np.empty((n, N))
+
+    den = b[0]
+    q[0] = d[0] / den
+    for i in range(1, n):
+        p[i - 1] = c[i - 1] / den
+        den = b[i] - a[i - 1] * p[i - 1]
+        q[i] = (d[i] - a[i - 1] * q[i - 1]) / den
+
+    x = np.empty((n, N))
+    x[n - 1] = q[n - 1]
+    for i in range(n - 2, -1, -1):
+        x[i] = q[i] - p[i] * x[i + 1]
+
+    return x.T.copy()
+
+
+def benchmark_multiples(n=1000, k=1000, N=1000):
+    """
+    Compara resolver_factorizado (k lados derechos) y thomas_lote (N sistemas)
+    contra llamar a thomas_bandas en un ciclo de Python.
+
+    Args:
+        n (int): Tamaño de cada sistema.
+        k (int): Número de lados derechos que comparten el operador.
+        N (int): Número de sistemas independientes.
+    """
+    import time
+
+    rng = np.random.default_rng(0)
+    a = rng.uniform(-1, 1, n - 1)
+    c = rng.uniform(-1, 1, n - 1)
+    b = 4 + rng.uniform(0, 1, n)
+    D = rng.standard_normal((n, k))
+
+    t0 = time.perf_counter()
+    X_ciclo = np.column_stack([thomas_bandas(a, b, c, D[:, j]) for j in range(k)])
+    t_ciclo = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    X = resolver_factorizado(factorizar_thomas(a, b, c), D)
+    t_fact = time.perf_counter() - t0
+
+    print(f"{k} lados derechos (n = {n}): ciclo {t_ciclo:.3f} s, factorizado {t_fact:.3f} s "
+          f"({t_ciclo / t_fact:.0f}x), diferencia máx. {np.max(np.abs(X - X_ciclo)):.1e}")
+
+    A = rng.uniform(-1, 1, (N, n - 1))
+    C = rng.uniform(-1, 1, (N, n - 1))
+    B = 4 + rng.uniform(0, 1, (N, n))
+    D = rng.standard_normal((N, n))
+
+    t0 = time.perf_counter()
+    X_ciclo = np.array([thomas_bandas(A[s], B[s], C[s], D[s]) for s in range(N)])
+    t_ciclo = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    X = thomas_lote(A, B, C, D)
+    t_lote = time.perf_counter() - t0
+
+    print(f"{N} sistemas (n = {n}): ciclo {t_ciclo:.3f} s, lote {t_lote:.3f} s "
+          f"({t_ciclo / t_lote:.0f}x), diferencia máx. {np.max(np.abs(X - X_ciclo)):.1e}")
+
+
+def bandas_a_densa(a, b, c):
+    """
+    Construye la matriz densa n x n a partir de sus diagonales (solo para pruebas pequeñas).
+
+    Args:
+        a (np.array): Subdiagonal (n-1).
+        b (np.array): Diagonal principal (n).
+        c (np.array): Superdiagonal (n-1).
+
+    Returns:
+        np.array: Matriz tridiagonal (n x n).
+    """
+    return np.diag(a, -1) + np.diag(b, 0) + np.diag(c, 1)
+
+
+def thomas(A, d):
+    """
+    Resuelve un sistema tridiagonal denso con el metodo de Thomas.
+
+    Se conserva por compatibilidad: extrae las diagonales de A y llama a thomas_bandas.
+
+    Args:
+        A (np.array): Matriz tridiagonal del sistema (n x n).
+        d (np.array): Vector del lado derecho (n).
+
+    Returns:
+        np.array: Solución del sistema (vector x).
+    """
+    return thomas_bandas(np.diag(A, -1), np.diag(A, 0), np.diag(A, 1), d)
@@ -0,0 +1,249 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from tridiagonal import thomas_bandas, thomas_multiple
+"""
+Solucionador tridiagonal paralelo por particiones (método SPIKE / Wang).
+
+El sistema de n renglones se divide en P bloques contiguos. Cada bloque k
+se resuelve de forma independiente (en un proceso distinto) para tres lados
+derechos: su parte de d (y), la "espiga" izquierda (v) generada por el
+acoplamiento a[s-1] con el bloque anterior y la espiga derecha (w) generada
+por c[e-1] con el bloque siguiente. La solución del bloque es
+
+    x[s:e] = y - v * x[s-1] - w * x[e]
+
+así que solo faltan los valores de frontera x[s] y x[e-1] de cada bloque.
+Estos 2P valores forman un sistema reducido pequeño que se resuelve en serie;
+después cada proceso reconstruye su parte de x. Las diagonales y los vectores
+de trabajo viven en memoria compartida, de modo que no se copian a los procesos.
+"""
+
+
+def es_diagonalmente_dominante(a, b, c, estricta=True):
+    """
+    Verifica la dominancia diagonal por filas de un sistema tridiagonal.
+
+    Args:
+        a (np.array): Subdiagonal (n-1).
+        b (np.array): Diagonal principal (n).
+        c (np.array): Superdiagonal (n-1).
+        estricta (bool): Si es True exige |b_i| > |a_{i-1}| + |c_i| en todas las filas.
+
+    Returns:
+        bool: True si el sistema es diagonalmente dominante.
+    """
+    vecinos = np.zeros(len(b))
+    vecinos[1:] += np.abs(a)
+    vecinos[:-1] += np.abs(c)
+    if estricta:
+        return bool(np.all(np.abs(b) > vecinos))
+    return bool(np.all(np.abs(b) >= vecinos))
+
+
+def _crear_compartido(tam, valores=None):
+    # Reserva un arreglo de tamaño tam en memoria compartida
+    shm = shared_memory.SharedMemory(create=True, size=max(tam, 1) * 8)
+    arreglo = np.ndarray((tam,), dtype=float, buffer=shm.buf)
+    if valores is not None:
+        arreglo[:] = valores
+    return shm, arreglo
+
+
+def _abrir_compartidos(nombres):
+    # Abre desde un proceso trabajador los arreglos creados por el proceso principal
+    shms = {k: shared_memory.SharedMemory(name=nombre) for k, (nombre, tam) in nombres.items()}
+    arreglos = {k: np.ndarray((tam,), dtype=float, buffer=shms[k].buf) for k, (nombre, tam) in nombres.items()}
+    return shms, arreglos
+
+
+def _cerrar_compartidos(shms, arreglos, liberar=False):
+    # Las vistas de NumPy deben soltarse antes de cerrar la memoria compartida
+    arreglos.clear()
+    for shm in shms.values():
+        shm.close()
+        if liberar:
+            shm.unlink()
+
+
+def _resolver_bloque(arr, n, s, e):
+    # Resuelve el bloque [s, e) para y, v y w con una sola eliminación: los tres
+    # lados derechos (d, la espiga izquierda en la primera fila y la derecha en la
+    # última) se resuelven juntos
+    a, b, c, d = arr["a"], arr["b"], arr["c"], arr["d"]
+    lados = np.zeros((e - s, 3))
+    lados[:, 0] = d[s:e]
+    if s > 0:
+        lados[0, 1] = a[s - 1]
+    if e < n:
+        lados[-1, 2] = c[e - 1]
+
+    sol = thomas_multiple(a[s:e - 1], b[s:e], c[s:e - 1], lados)
+    arr["y"][s:e] = sol[:, 0]
+    arr["v"][s:e] = sol[:, 1]
+    arr["w"][s:e] = sol[:, 2]
+
+
+def _fase_local(nombres, n, s, e):
+    shms, arr = _abrir_compartidos(nombres)
+    try:
+        _resolver_bloque(arr, n, s, e)
+    finally:
+        _cerrar_compartidos(shms, arr)
+
+
+def _fase_reconstruccion(nombres, s, e, x_izq, x_der):
+    # x[s:e] = y - v * x[s-1] - w * x[e]
+    shms, arr = _abrir_compartidos(nombres)
+    try:
+        arr["x"][s:e] = arr["y"][s:e] - arr["v"][s:e] * x_izq - arr["w"][s:e] * x_der
+    finally:
+        _cerrar_compartidos(shms, arr)
+
+
+def sistema_reducido(y, v, w, cortes):
+    """
+    Construye y resuelve el sistema de interfaz para los valores x[s_k] y x[e_k - 1].
+
+    Las incógnitas se ordenan [f_0, l_0, f_1, l_1, ...] (primer y último valor de
+    cada bloque) y cumplen
+
+        f_k + v[s_k] l_{k-1} + w[s_k] f_{k+1} = y[s_k]
+        l_k + v[e_k-1] l_{k-1} + w[e_k-1] f_{k+1} = y[e_k-1]
+
+    Args:
+        y, v, w (np.array): Soluciones locales de los bloques (n).
+        cortes (list): Pares (s_k, e_k) de cada bloque.
+
+    Returns:
+        np.array: Vector (2P) con [f_0, l_0, f_1, l_1, ...].
+    """
+    P = len(cortes)
+    M = np.eye(2 * P)
+    rhs = np.zeros(2 * P)
+
+    for k, (s, e) in enumerate(cortes):
+        for fila, r in ((2 * k, s), (2 * k + 1, e - 1)):
+            rhs[fila] = y[r]
+            if k > 0:
+                M[fila, 2 * k - 1] += v[r]      # l_{k-1} = x[s-1]
+            if k < P - 1:
+                M[fila, 2 * k + 2] += w[r]      # f_{k+1} = x[e]
+
+    interfaz = np.linalg.solve(M, rhs)
+    if not np.all(np.isfinite(interfaz)):
+        raise ValueError("El sistema reducido de interfaz es singular o mal condicionado")
+    return interfaz
+
+
+def thomas_paralelo(a, b, c, d, procesos=None, bloques=None, forzar=False):
+    """
+    Resuelve un sistema tridiagonal repartiendo bloques entre un pool de procesos.
+
+    El método no pivotea, así que solo es estable para sistemas diagonalmente
+    dominantes (o simétricos definidos positivos); con forzar=True se omite la
+    verificación.
+
+    Args:
+        a (np.array): Subdiagonal (n-1).
+        b (np.array): Diagonal principal (n).
+        c (np.array): Superdiagonal (n-1).
+        d (np.array): Vector del lado derecho (n).
+        procesos (int): Número de procesos trabajadores (por defecto os.cpu_count()).
+        bloques (int): Número de bloques de la partición (por defecto igual a procesos).
+        forzar (bool): Si es True no se verifica la dominancia diagonal.
+
+    Returns:
+        np.array: Solución del sistema (vector x de tamaño n).
+    """
+    import os
+
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    c = np.asarray(c, dtype=float)
+    d = np.asarray(d, dtype=float).ravel()
+    n = len(d)
+
+    if len(b) != n or len(a) != n - 1 or len(c) != n - 1:
+        raise ValueError("Las diagonales no son compatibles con el tamaño del sistema")
+    if not forzar and not es_diagonalmente_dominante(a, b, c, estricta=False):
+        raise ValueError("El sistema no es diagonalmente dominante: la partición sin pivoteo "
+                         "puede ser inestable (use forzar=True para resolverlo de todos modos)")
+
+    procesos = procesos or os.cpu_count()
+    bloques = min(bloques or procesos, n)
+    if bloques <= 1:
+        return thomas_bandas(a, b, c, d)
+
+    limites = np.linspace(0, n, bloques + 1).astype(int)
+    cortes = list(zip(limites[:-1], limites[1:]))
+
+    shms, arr = {}, {}
+    try:
+        for nombre, valores, tam in (("a", a, n - 1), ("b", b, n), ("c", c, n - 1), ("d", d, n),
+                                     ("y", None, n), ("v", None, n), ("w", None, n), ("x", None, n)):
+            shms[nombre], arr[nombre] = _crear_compartido(tam, valores)
+        nombres = {k: (shm.name, arr[k].shape[0]) for k, shm in shms.items()}
+
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            # Paso 1: soluciones locales y espigas de cada bloque
+            list(pool.map(_fase_local, *zip(*[(nombres, n, s, e) for s, e in cortes])))
+
+            # Paso 2: sistema reducido de interfaz (en serie)
+            interfaz = sistema_reducido(arr["y"], arr["v"], arr["w"], cortes)
+
+            # Paso 3: reconstrucción de x en cada bloque
+            tareas = []
+            for k, (s, e) in enumerate(cortes):
+                x_izq = interfaz[2 * k - 1] if k > 0 else 0.0
+                x_der = interfaz[2 * k + 2] if k < bloques - 1 else 0.0
+                tareas.append((nombres, s, e, x_izq, x_der))
+            list(pool.map(_fase_reconstruccion, *zip(*tareas)))
+
+        x = arr["x"].copy()
+    finally:
+        _cerrar_compartidos(shms, arr, liberar=True)
+
+    if not np.all(np.isfinite(x)):
+        raise ValueError("La solución contiene valores no finitos")
+    return x
+
+
+def benchmark_escalamiento(n=10**7, max_procesos=None):
+    """
+    Mide el tiempo de thomas_paralelo con 1, 2, 4, ..., max_procesos procesos
+    contra thomas_bandas en serie, en un sistema diagonalmente dominante.
+
+    Args:
+        n (int): Tamaño del sistema.
+        max_procesos (int): Número máximo de procesos (por defecto os.cpu_count()).
+    """
+    import os
+    import time
+
+    max_procesos = max_procesos or os.cpu_count()
+    rng = np.random.default_rng(0)
+    a = rng.uniform(-1, 1, n - 1)
+    c = rng.uniform(-1, 1, n - 1)
+    b = 2.5 + rng.uniform(0, 1, n)
+    d = rng.standard_normal(n)
+
+    t0 = time.perf_counter()
+    x_serie = thomas_bandas(a, b, c, d)
+    t_serie = time.perf_counter() - t0
+    print(f"serie      : {t_serie:8.3f} s")
+
+    procesos = 1
+    while True:
+        t0 = time.perf_counter()
+        x = thomas_paralelo(a, b, c, d, procesos=procesos, bloques=max(procesos, 2))
+        t = time.perf_counter() - t0
+        print(f"{procesos:3d} procesos: {t:8.3f} s  aceleración {t_serie / t:5.2f}x  "
+              f"diferencia máx. {np.max(np.abs(x - x_serie)):.1e}")
+        if procesos >= max_procesos:
+            break
+        procesos = min(2 * procesos, max_procesos)
+
+
+if __name__ == "__main__":
+    benchmark_escalamiento()
@@ -0,0 +1,271 @@
+import functools
+
+import numpy as np
+
+# Máximo de expresiones de texto compiladas que se conservan en memoria
+# (se descartan las usadas hace más tiempo)
+MAX_FUNCIONES_COMPILADAS = 1024
+
+
+# Compila con sympy una expresión de texto ya normalizada. El caché LRU evita
+# procesar dos veces la misma expresión sin crecer sin límite
+@functools.lru_cache(maxsize=MAX_FUNCIONES_COMPILADAS)
+def _compilar_texto(clave):
+    import sympy as sp
+    x = sp.symbols('x')
+    return sp.lambdify(x, sp.sympify(clave), 'numpy')
+
+
+# Convierte la entrada en una función numérica de x. Acepta una función de
+# Python (se usa tal cual) o un texto como 'sin(x)**2 - x**2 + 1' (se compila
+# con sympy la primera vez y luego se toma del caché)
+def compilar_funcion(f1):
+    if callable(f1):
+        return f1
+    return _compilar_texto(str(f1).replace(" ", ""))
+
+
+# Evalúa f en todos los puntos c con una sola llamada. Si f no está
+# vectorizada (falla con arreglos, p. ej. por un `if x > 0`, o retorna un
+# escalar), se evalúa punto por punto
+def evaluar_vectorizado(f, c):
+    try:
+        fc = np.asarray(f(c), dtype=float)
+    except (TypeError, ValueError):
+        fc = None
+    if fc is None or fc.shape != c.shape:
+        fc = np.array([f(ck) for ck in c], dtype=float)
+    return fc
+
+
+# Método modificado de la bisección: divide [a, b] en n subintervalos, busca el
+# primero donde f cambia de signo y aplica bisección sobre él.
+# Cada iteración evalúa f una sola vez (en el punto medio): f(a_new) se
+# conserva de la iteración anterior. El barrido de los c_k es una sola
+# evaluación vectorizada de f, que también da f(a) y f(b)
+def metodo_biseccion_mod(f1, a, b, n, tol, iterMax, mostrar=True):
+    """
+    Aproxima una raíz de f(x) = 0 en [a, b] con el método modificado de la bisección.
+
+    Args:
+        f1 (callable o str): Función de x, o su expresión de texto (p. ej. 'sin(x)**2 - x**2 + 1').
+        a, b (float): Extremos del intervalo.
+        n (int): Número de subintervalos del barrido inicial.
+        tol (float): Tolerancia sobre |f(x_k)|.
+        iterMax (int): Número máximo de iteraciones de bisección.
+        mostrar (bool): Si es True imprime el número de iteraciones al converger.
+
+    Returns:
+        float: Aproximación x_k de la raíz, o None si f(a) y f(b) tienen el mismo signo.
+    """
+    f = compilar_funcion(f1)
+
+    # Calcular los puntos c_k y evaluar f en todos a la vez
+    h = (b - a) / n
+    c = a + h * np.arange(n + 1)
+    fc = evaluar_vectorizado(f, c)
+
+    # Verificación del teorema de Bolzano
+    if fc[0] * fc[-1] >= 0:
+        print("No cumple el teorema de Bolzano. La función no cambia de signo en el intervalo.")
+        return None
+
+    # Buscar el primer subintervalo donde f cambia de signo
+    cambio = np.flatnonzero(fc[:-1] * fc[1:] < 0)
+    if len(cambio) == 0:
+        raise ValueError("No se encontró un subintervalo válido donde f cambie de signo.")
+    k = cambio[0]
+    a_new, b_new = float(c[k]), float(c[k + 1])
+    f_a = float(fc[k])
+
+    # Aplicar el método de bisección sobre el subintervalo seleccionado
+    for i in range(iterMax):
+        x_k = (a_new + b_new) / 2
+        f_x = float(f(x_k))
+        if f_a * f_x < 0:
+            b_new = x_k
+        else:
+            a_new, f_a = x_k, f_x
+
+        error = abs(f_x)
+        if error < tol:
+            if mostrar:
+                print(f"Convergencia alcanzada después de {i + 1} iteraciones, con el error {error}")
+            return x_k
+
+    raise ValueError("El método no convergió después del número máximo de iteraciones.")
+
+
+# Bisección sobre muchos intervalos [a_i, b_i] a la vez (f(a_i) y f(b_i) con
+# signos opuestos). En cada iteración se evalúa f una sola vez sobre los puntos
+# medios de los intervalos que aún no convergen; cada uno se detiene cuando
+# |f(x)| < tol o cuando el intervalo ya no se puede dividir en punto flotante
+def biseccion_lote(f1, a, b, fa, tol, iterMax):
+    """
+    Refina simultáneamente varios intervalos con cambio de signo por bisección.
+
+    Args:
+        f1 (callable o str): Función de x (vectorizada) o su expresión de texto.
+        a, b (np.array): Extremos de los intervalos.
+        fa (np.array): Valores f(a).
+        tol (float): Tolerancia sobre |f(x_k)|.
+        iterMax (int): Número máximo de iteraciones.
+
+    Returns:
+        tuple: (raices, iteraciones, convergido), arreglos del tamaño de a.
+    """
+    f = compilar_funcion(f1)
+    a = np.array(a, dtype=float)
+    b = np.array(b, dtype=float)
+    fa = np.array(fa, dtype=float)
+    x = (a + b) / 2
+    iteraciones = np.zeros(len(a), dtype=int)
+    activos = np.ones(len(a), dtype=bool)
+
+    for i in range(iterMax):
+        idx = np.flatnonzero(activos)
+        if len(idx) == 0:
+            break
+        x[idx] = (a[idx] + b[idx]) / 2
+        fx = evaluar_vectorizado(f, x[idx])
+        iteraciones[idx] += 1
+
+        izquierda = fa[idx] * fx < 0
+        b[idx[izquierda]] = x[idx[izquierda]]
+        derecha = idx[~izquierda]
+        a[derecha] = x[derecha]
+        fa[derecha] = fx[~izquierda]
+
+        listo = (np.abs(fx) < tol) | (b[idx] - a[idx] <= 2 * np.spacing(np.abs(x[idx])))
+        activos[idx[listo]] = False
+
+    return x, iteraciones, ~activos
+
+
+# Índices k donde f cambia de signo entre c_k y c_{k+1}
+def _cambios_de_signo(fc):
+    return np.flatnonzero(fc[:-1] * fc[1:] < 0)
+
+
+# Mínimos locales de |f| en la malla sin cambio de signo alrededor: ahí puede
+# haber una raíz doble o dos raíces muy cercanas que la malla no separa.
+# fc puede ser una malla (n+1) o varias mallas por filas (P x m)
+def _minimos_sospechosos(fc):
+    centro = np.abs(fc[..., 1:-1])
+    mismo_signo = (fc[..., :-2] * fc[..., 1:-1] > 0) & (fc[..., 1:-1] * fc[..., 2:] > 0)
+    minimo = (centro < np.abs(fc[..., :-2])) & (centro <= np.abs(fc[..., 2:]))
+    return np.nonzero(mismo_signo & minimo)
+
+
+# Encuentra todas las raíces de f en [a, b]: evalúa f una vez en una malla de
+# n subintervalos, toma todos los cambios de signo y los refina juntos con
+# biseccion_lote. Con refinar > 0, alrededor de cada mínimo local de |f| sin
+# cambio de signo se evalúa una malla más fina (todas a la vez), hasta
+# `refinar` niveles, para separar raíces cercanas; si |f| del mínimo ya es
+# menor que tol se acepta como raíz (raíz doble, donde f no cambia de signo)
+def todas_las_raices(f1, a, b, n, tol=1e-10, iterMax=200, refinar=0, subdivisiones=16):
+    """
+    Aproxima todas las raíces de f(x) = 0 en [a, b].
+
+    Args:
+        f1 (callable o str): Función de x (vectorizada) o su expresión de texto.
+        a, b (float): Extremos del intervalo.
+        n (int): Número de subintervalos de la malla inicial.
+        tol (float): Tolerancia sobre |f(x)|.
+        iterMax (int): Número máximo de iteraciones de bisección.
+        refinar (int): Niveles de refinamiento adaptativo alrededor de mínimos de |f|.
+        subdivisiones (int): Subintervalos de cada malla local de refinamiento.
+
+    Returns:
+        np.array: Raíces encontradas, en orden creciente.
+    """
+    f = compilar_funcion(f1)
+    c = a + (b - a) / n * np.arange(n + 1)
+    fc = evaluar_vectorizado(f, c)
+
+    raices = [c[fc == 0]]
+    k = _cambios_de_signo(fc)
+    izq, der, f_izq = [c[k]], [c[k + 1]], [fc[k]]
+
+    # Intervalos [c_{k-1}, c_{k+1}] alrededor de los mínimos sospechosos
+    j = _minimos_sospechosos(fc)[0] + 1
+    aceptar = np.abs(fc[j]) < tol
+    raices.append(c[j[aceptar]])
+    L, R = c[j[~aceptar] - 1], c[j[~aceptar] + 1]
+
+    for nivel in range(refinar):
+        if len(L) == 0:
+            break
+        # Mallas locales (una por fila) evaluadas con una sola llamada a f
+        t = np.linspace(0, 1, subdivisiones + 1)
+        malla = L[:, None] + (R - L)[:, None] * t
+        fm = evaluar_vectorizado(f, malla.ravel()).reshape(malla.shape)
+
+        raices.append(malla[:, 1:-1][fm[:, 1:-1] == 0])
+        fila, col = np.nonzero(fm[:, :-1] * fm[:, 1:] < 0)
+        izq.append(malla[fila, col])
+        der.append(malla[fila, col + 1])
+        f_izq.append(fm[fila, col])
+
+        fila, col = _minimos_sospechosos(fm)
+        col = col + 1
+        aceptar = np.abs(fm[fila, col]) < tol
+        raices.append(malla[fila[aceptar], col[aceptar]])
+        fila, col = fila[~aceptar], col[~aceptar]
+        L, R = malla[fila, col - 1], malla[fila, col + 1]
+
+    izq, der, f_izq = np.concatenate(izq), np.concatenate(der), np.concatenate(f_izq)
+    if len(izq):
+        x, _, _ = biseccion_lote(f, izq, der, f_izq, tol, iterMax)
+        raices.append(x)
+
+    raices = np.sort(np.concatenate(raices))
+    # Una raíz exacta en el borde de una malla local puede aparecer dos veces
+    if len(raices) > 1:
+        distinta = np.diff(raices) > 4 * np.spacing(np.maximum(np.abs(raices[1:]), 1.0))
+        raices = raices[np.concatenate(([True], distinta))]
+    return raices
+
+
+if __name__ == "__main__":
+    import time
+
+    # Parámetros del ejercicio
+    f1 = 'sin(x)**2 - x**2 + 1'
+    a = 0
+    b = 2
+    n = 10
+    tol = 1e-10
+    iterMax = 1000
+
+    try:
+        solucion = metodo_biseccion_mod(f1, a, b, n, tol, iterMax)
+        if solucion is not None:
+            print(f"La solución aproximada es: {solucion}")
+    except ValueError as e:
+        print(e)
+
+    # Número de evaluaciones de f y tiempo de muchas llamadas con la misma expresión
+    f = compilar_funcion(f1)
+    evaluaciones = [0]
+
+    def f_contada(x):
+        evaluaciones[0] += np.size(x)
+        return f(x)
+
+    metodo_biseccion_mod(f_contada, a, b, n, tol, iterMax, mostrar=False)
+    print(f"Evaluaciones de f: {evaluaciones[0]}")
+
+    t0 = time.perf_counter()
+    for _ in range(10000):
+        metodo_biseccion_mod(f1, a, b, n, tol, iterMax, mostrar=False)
+    print(f"10000 llamadas con texto: {time.perf_counter() - t0:.3f} s")
+
+    # Todas las raíces de una función con varias raíces en el intervalo
+    print("Raíces de sin(5x) + 0.3 en [0, 4]:", todas_las_raices('sin(5*x) + 0.3', 0, 4, 50))
+    # Dos raíces muy cercanas (x = 1 y x = 1.001) que la malla gruesa no separa
+    print("Raíces de (x - 1)(x - 1.001)(x + 2) en [-3, 3] con refinamiento:",
+          todas_las_raices('(x - 1)*(x - 1.001)*(x + 2)', -3, 3, 20, refinar=4))
+    # Raíz doble en x = 1: f no cambia de signo, solo la encuentra el refinamiento
+    print("Raíces de (x - 1)^2 (x + 2) en [-3, 3] con refinamiento:",
+          todas_las_raices('(x - 1)**2*(x + 2)', -3, 3, 20, refinar=6))
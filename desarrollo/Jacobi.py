@@ -1,3 +1,7 @@
+import contextlib
+import math
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 # Calcula el ángulo θ necesario para anular el elemento A[i, j] mediante rotación
@@ -61,15 +65,351 @@ def jacobi_valores_propios(A, iterMax, tol):
 
     return np.diag(Ak)  # Retorna los valores propios aproximados
 
+# Calcula t = tan(θ), c = cos(θ) y s = sin(θ) de la rotación que anula A[i, j]
+# usando las fórmulas estables (sin arctan): t es la raíz de menor módulo de
+# t^2 + 2*tau*t - 1 = 0, con tau = (A[i, i] - A[j, j]) / (2*A[i, j])
+def parametros_rotacion(A, i, j):
+    a_ij = A[i, j]
+    if a_ij == 0.0:
+        return 0.0, 1.0, 0.0  # Nada que anular: rotación identidad
+
+    tau = (A[i, i] - A[j, j]) / (2 * a_ij)
+    if tau >= 0:
+        t = 1.0 / (tau + math.sqrt(1.0 + tau * tau))
+    else:
+        t = -1.0 / (-tau + math.sqrt(1.0 + tau * tau))
+    c = 1.0 / math.sqrt(1.0 + t * t)
+    s = t * c
+    return t, c, s
+
+# Aplica in situ el producto V @ G: solo cambian las columnas i y j, O(m)
+def rotar_columnas(V, i, j, c, s):
+    col_i = V[:, i].copy()
+    V[:, i] = c * col_i + s * V[:, j]
+    V[:, j] = c * V[:, j] - s * col_i
+
+# Aplica in situ la transformación de similitud G.T @ A @ G, donde G es la
+# rotación de matriz_rotacion. Solo cambian las filas/columnas i y j: O(m)
+def rotar_en_sitio(A, i, j, t, c, s):
+    a_ii, a_jj, a_ij = A[i, i], A[j, j], A[i, j]
+
+    rotar_columnas(A, i, j, c, s)
+    A[i, :] = A[:, i]  # La matriz sigue siendo simétrica
+    A[j, :] = A[:, j]
+
+    # Los elementos del bloque 2x2 se fijan con las fórmulas exactas
+    A[i, i] = a_ii + t * a_ij
+    A[j, j] = a_jj - t * a_ij
+    A[i, j] = 0.0
+    A[j, i] = 0.0
+
+# Método de Jacobi con rotaciones de Givens aplicadas in situ.
+# Mismo recorrido y criterio de parada que jacobi_valores_propios, pero cada
+# barrido cuesta O(m^3) en lugar de O(m^5) y no crea matrices m x m por rotación
+def jacobi_valores_propios_givens(A, iterMax, tol):
+    Ak = np.array(A, dtype=float)  # Copia de trabajo (se modifica in situ)
+    m = Ak.shape[0]
+    xk = np.diag(Ak).copy()
+
+    for _ in range(iterMax):
+        for i in range(m):
+            for j in range(i + 1, m):
+                t, c, s = parametros_rotacion(Ak, i, j)
+                if t != 0.0:
+                    rotar_en_sitio(Ak, i, j, t, c, s)
+
+        xk_next = np.diag(Ak).copy()
+        ek = np.linalg.norm(xk_next - xk)  # Criterio de convergencia: cambio entre iteraciones
+
+        if ek < tol:
+            break
+
+        xk = xk_next
+
+    return np.diag(Ak).copy()
+
+# Norma de Frobenius de la parte fuera de la diagonal: off(A)
+def norma_fuera_diagonal(A):
+    return np.linalg.norm(A - np.diag(np.diag(A)))
+
+# Orden paralelo (torneo round-robin): agrupa los m(m-1)/2 pares (i, j) en
+# rondas de pares disjuntos. Con m par hay m-1 rondas; con m impar se agrega
+# un índice ficticio y hay m rondas. Retorna una lista de arreglos (I, J), I < J
+def orden_paralelo(m):
+    M = m + (m % 2)             # Número de "jugadores" (par)
+    jugadores = list(range(M))
+    rondas = []
+
+    for _ in range(M - 1):
+        I, J = [], []
+        for k in range(M // 2):
+            p, q = jugadores[k], jugadores[M - 1 - k]
+            if p < m and q < m:  # Se descarta el emparejamiento con el ficticio
+                I.append(min(p, q))
+                J.append(max(p, q))
+        rondas.append((np.array(I, dtype=int), np.array(J, dtype=int)))
+        # El jugador 0 queda fijo y el resto rota una posición
+        jugadores = [jugadores[0], jugadores[-1]] + jugadores[1:-1]
+
+    return rondas
+
+# Versión vectorizada de parametros_rotacion para un conjunto de pares (I, J).
+# A puede ser una matriz (m, m) o una pila de matrices (N, m, m)
+def parametros_rotacion_ronda(A, I, J):
+    a_ij = A[..., I, J]
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        tau = (A[..., I, I] - A[..., J, J]) / (2 * a_ij)
+        signo = np.where(tau >= 0, 1.0, -1.0)
+        t = signo / (np.abs(tau) + np.sqrt(1.0 + tau * tau))
+    t = np.where(a_ij == 0.0, 0.0, t)
+    c = 1.0 / np.sqrt(1.0 + t * t)
+    s = t * c
+    return t, c, s
+
+# Aplica G.T @ V a las columnas inicio:fin, con G el producto de las
+# rotaciones (disjuntas) de una ronda. Solo toca filas completas de V, que
+# son contiguas en memoria
+def _rotar_filas_ronda(V, I, J, c, s, inicio, fin):
+    fila_I = V[..., I, inicio:fin]
+    fila_J = V[..., J, inicio:fin]
+    V[..., I, inicio:fin] = c[..., None] * fila_I + s[..., None] * fila_J
+    V[..., J, inicio:fin] = c[..., None] * fila_J - s[..., None] * fila_I
+
+# Ejecuta fn(inicio, fin) sobre bloques de 0:n, en serie o en un pool de hilos
+# (NumPy libera el GIL en las operaciones sobre bloques grandes). Se usan
+# `hilos` bloques, el mismo número de hilos con que se creó el pool
+def _por_bloques(fn, n, pool, hilos):
+    if pool is None or hilos <= 1:
+        fn(0, n)
+        return
+    bloques = np.linspace(0, n, hilos + 1).astype(int)
+    futuros = [pool.submit(fn, inicio, fin) for inicio, fin in zip(bloques[:-1], bloques[1:]) if fin > inicio]
+    for futuro in futuros:
+        futuro.result()
+
+# Aplica in situ todas las rotaciones de una ronda en una sola actualización.
+# Como A es simétrica, G.T @ A @ G = G.T @ (G.T @ A).T, así que solo se usan
+# operaciones por filas. Vt guarda V transpuesta: (V @ G).T = G.T @ Vt.
+# También acepta pilas (N, m, m); Vt puede ser None si no se acumula V.
+# pool es un ThreadPoolExecutor opcional con `hilos` hilos
+def rotar_ronda(A, Vt, I, J, pool=None, hilos=1):
+    t, c, s = parametros_rotacion_ronda(A, I, J)
+    a_ii, a_jj, a_ij = A[..., I, I], A[..., J, J], A[..., I, J]
+    m = A.shape[-1]
+
+    _por_bloques(lambda ini, fin: _rotar_filas_ronda(A, I, J, c, s, ini, fin), m, pool, hilos)
+    A[...] = np.swapaxes(A, -1, -2).copy()
+    _por_bloques(lambda ini, fin: _rotar_filas_ronda(A, I, J, c, s, ini, fin), m, pool, hilos)
+    if Vt is not None:
+        _por_bloques(lambda ini, fin: _rotar_filas_ronda(Vt, I, J, c, s, ini, fin), Vt.shape[-1], pool, hilos)
+
+    # Los bloques 2x2 se fijan con las fórmulas exactas
+    A[..., I, I] = a_ii + t * a_ij
+    A[..., J, J] = a_jj - t * a_ij
+    A[..., I, J] = 0.0
+    A[..., J, I] = 0.0
+
+# Método de Jacobi con acumulación de vectores propios.
+# Se detiene cuando off(A) < tol y omite las rotaciones con |a_ij| <= umbral;
+# si un barrido completo no aplica ninguna rotación, ya no puede avanzar y
+# también se detiene (off(A) puede quedar >= tol por culpa del umbral).
+# orden="filas" recorre los pares fila por fila (cíclico por filas);
+# orden="paralelo" aplica cada ronda de orden_paralelo como una sola
+# actualización, repartida entre `hilos` hilos si hilos > 1.
+# Retorna los valores propios, la matriz V (columnas = vectores propios,
+# A @ V = V @ diag(valores)) y un diccionario con barridos, rotaciones, off(A),
+# convergido (off(A) < tol) y motivo de parada ("tol", "umbral" o "iterMax")
+def jacobi_vectores_propios(A, iterMax, tol, umbral=0.0, orden="filas", hilos=None):
+    if orden not in ("filas", "paralelo"):
+        raise ValueError(f"Orden desconocido: {orden}")
+
+    Ak = np.array(A, dtype=float)
+    m = Ak.shape[0]
+    V = np.eye(m)
+
+    barridos = 0
+    rotaciones = 0
+    off = norma_fuera_diagonal(Ak)
+
+    hilos = hilos if orden == "paralelo" and hilos is not None and hilos > 1 else 1
+    rondas = orden_paralelo(m) if orden == "paralelo" else None
+
+    # El pool de hilos se cierra aunque alguna ronda lance una excepción
+    with (ThreadPoolExecutor(max_workers=hilos) if hilos > 1 else contextlib.nullcontext()) as pool:
+        while off >= tol and barridos < iterMax:
+            rotaciones_barrido = 0
+            if orden == "paralelo":
+                Vt = V.T.copy()
+                for I, J in rondas:
+                    activos = np.abs(Ak[I, J]) > umbral  # Rotaciones que sí aportan
+                    if not np.any(activos):
+                        continue
+                    rotar_ronda(Ak, Vt, I[activos], J[activos], pool, hilos)
+                    rotaciones_barrido += int(np.count_nonzero(activos))
+                V = Vt.T.copy()
+            else:
+                for i in range(m):
+                    for j in range(i + 1, m):
+                        if abs(Ak[i, j]) <= umbral:
+                            continue  # Rotación que no aporta: no se paga
+                        t, c, s = parametros_rotacion(Ak, i, j)
+                        rotar_en_sitio(Ak, i, j, t, c, s)
+                        rotar_columnas(V, i, j, c, s)  # V <- V @ G
+                        rotaciones_barrido += 1
+
+            barridos += 1
+            if rotaciones_barrido == 0:
+                break  # Todos los |a_ij| <= umbral: más barridos no cambian nada
+            rotaciones += rotaciones_barrido
+            off = norma_fuera_diagonal(Ak)
+
+    if off < tol:
+        motivo = "tol"
+    elif barridos > 0 and rotaciones_barrido == 0:
+        motivo = "umbral"
+    else:
+        motivo = "iterMax"
+    info = {"barridos": barridos, "rotaciones": rotaciones, "norma_off": float(off),
+            "convergido": bool(off < tol), "motivo": motivo}
+    return np.diag(Ak).copy(), V, info
+
+# Método de Jacobi por lotes para una pila de N matrices simétricas (N, m, m).
+# Cada ronda de orden_paralelo se aplica a las N matrices a la vez; las
+# matrices con off(A) < tol dejan de rotarse. Retorna los valores propios
+# (N, m), los vectores propios (N, m, m) si vectores=True (si no, None) y la
+# máscara (N,) de matrices que convergieron en iterMax barridos
+def jacobi_lote(A, iterMax, tol, vectores=False):
+    Ak = np.array(A, dtype=float)
+    if Ak.ndim != 3 or Ak.shape[1] != Ak.shape[2]:
+        raise ValueError("Se espera un arreglo de forma (N, m, m)")
+    N, m, _ = Ak.shape
+
+    Vt = np.broadcast_to(np.eye(m), (N, m, m)).copy() if vectores else None
+    rondas = orden_paralelo(m)
+    diagonal = np.arange(m)
+
+    def off_lote(B):
+        B = B.copy()
+        B[:, diagonal, diagonal] = 0.0
+        return np.sqrt(np.sum(B * B, axis=(1, 2)))
+
+    convergido = off_lote(Ak) < tol
+    for _ in range(iterMax):
+        activos = np.flatnonzero(~convergido)
+        if activos.size == 0:
+            break
+
+        Bk = Ak[activos]
+        Wt = Vt[activos] if vectores else None
+        for I, J in rondas:
+            rotar_ronda(Bk, Wt, I, J)
+
+        Ak[activos] = Bk
+        if vectores:
+            Vt[activos] = Wt
+        convergido[activos] = off_lote(Bk) < tol
+
+    valores = Ak[:, diagonal, diagonal].copy()
+    V = np.swapaxes(Vt, 1, 2).copy() if vectores else None
+    return valores, V, convergido
+
+# Matriz de prueba A_ij = 0.5 * (i + j + 2) de tamaño m x m
+def matriz_prueba(m):
+    idx = np.arange(1, m + 1)
+    return 0.5 * (idx[:, None] + idx[None, :])
+
+# Compara el tiempo de un barrido completo de ambas versiones para cada m.
+# La versión densa con m = 400 tarda varios minutos (80 000 productos 400 x 400)
+def benchmark_jacobi(tamanos=(15, 100, 400), barridos=1):
+    import time
+
+    print(f"{'m':>5} {'densa (s)':>12} {'givens (s)':>12} {'aceleración':>12}")
+    for m in tamanos:
+        A = matriz_prueba(m)
+
+        t0 = time.perf_counter()
+        jacobi_valores_propios(A, iterMax=barridos, tol=0.0)
+        t_densa = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        jacobi_valores_propios_givens(A, iterMax=barridos, tol=0.0)
+        t_givens = time.perf_counter() - t0
+
+        print(f"{m:>5} {t_densa:>12.4f} {t_givens:>12.4f} {t_densa / t_givens:>11.1f}x")
+
+# Compara el tiempo de un barrido en orden cíclico por filas contra el orden
+# paralelo (rondas vectorizadas, con y sin pool de hilos) para m >= 500
+def benchmark_paralelo(tamanos=(500, 1000), hilos=None):
+    import os
+    import time
+
+    hilos = hilos or os.cpu_count()
+    rng = np.random.default_rng(0)
+    print(f"{'m':>5} {'filas (s)':>10} {'paralelo (s)':>13} {f'{hilos} hilos (s)':>13} {'aceleración':>12}")
+    for m in tamanos:
+        A = rng.standard_normal((m, m))
+        A = A + A.T
+
+        t0 = time.perf_counter()
+        jacobi_vectores_propios(A, iterMax=1, tol=0.0, orden="filas")
+        t_filas = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        jacobi_vectores_propios(A, iterMax=1, tol=0.0, orden="paralelo")
+        t_ronda = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        jacobi_vectores_propios(A, iterMax=1, tol=0.0, orden="paralelo", hilos=hilos)
+        t_hilos = time.perf_counter() - t0
+
+        mejor = min(t_ronda, t_hilos)
+        print(f"{m:>5} {t_filas:>10.3f} {t_ronda:>13.3f} {t_hilos:>13.3f} {t_filas / mejor:>11.1f}x")
+
+# Rendimiento (matrices por segundo) de jacobi_lote contra un ciclo de Python
+# que llama a jacobi_valores_propios_givens matriz por matriz
+def benchmark_lote(N=100_000, tamanos=(3, 6, 20), muestra_ciclo=200):
+    import time
+
+    rng = np.random.default_rng(0)
+    print(f"{'m':>4} {'ciclo (mat/s)':>14} {'lote (mat/s)':>14} {'lote+V (mat/s)':>15} {'convergidas':>12}")
+    for m in tamanos:
+        A = rng.standard_normal((N, m, m))
+        A = A + np.swapaxes(A, 1, 2)
+
+        t0 = time.perf_counter()
+        for k in range(muestra_ciclo):
+            jacobi_valores_propios_givens(A[k], iterMax=100, tol=1e-12)
+        ciclo = muestra_ciclo / (time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        _, _, convergido = jacobi_lote(A, iterMax=100, tol=1e-12)
+        lote = N / (time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        jacobi_lote(A, iterMax=100, tol=1e-12, vectores=True)
+        lote_v = N / (time.perf_counter() - t0)
+
+        print(f"{m:>4} {ciclo:>14.0f} {lote:>14.0f} {lote_v:>15.0f} {np.count_nonzero(convergido):>12}")
+
 # Prueba del algoritmo con una matriz definida de 15x15
 def prueba_jacobi():
-    A = np.zeros((15,15))
-    for i in range(15):
-        for j in range(15):
-            A[i,j] = 0.5 * ((i+1) + (j+1))  # Elementos A_ij = 0.5 * (i + j + 2)
+    A = matriz_prueba(15)  # Elementos A_ij = 0.5 * (i + j + 2)
 
     valores_propios = jacobi_valores_propios(A, iterMax=1000, tol=1e-10)
     print("Valores propios calculados :", np.sort(valores_propios))
 
-# Ejecuta la prueba
-prueba_jacobi()
+    valores_givens = jacobi_valores_propios_givens(A, iterMax=1000, tol=1e-10)
+    print("Valores propios (Givens)   :", np.sort(valores_givens))
+
+    valores, V, info = jacobi_vectores_propios(A, iterMax=1000, tol=1e-10)
+    print("Residuo ||AV - VD||        :", np.linalg.norm(A @ V - V * valores))
+    print("Barridos, rotaciones, off  :", info["barridos"], info["rotaciones"], info["norma_off"])
+
+if __name__ == "__main__":
+    import sys
+
+    # Ejecuta la prueba; la comparación de tiempos (incluye la versión densa
+    # O(m^5) con m = 400, varios minutos) solo con: python Jacobi.py --benchmark
+    prueba_jacobi()
+    if "--benchmark" in sys.argv[1:]:
+        benchmark_jacobi()
@@ -0,0 +1,136 @@
+import numpy as np
+
+# Tolerancia y número máximo de iteraciones
+tol = 1e-10
+iterMax = 100
+
+
+# Definición de la función f(x) del ejercicio
+def f(x):
+    return x**2 - np.exp(x) - 3*x + 2
+
+
+# Derivada de la función f(x)
+def df(x):
+    return 2*x - np.exp(x) - 3
+
+
+# Factor corrector del método NHO a partir de los valores df(x) y df(z):
+# H(x, z) = (df(x) - df(z)) / (3 df(z) - df(x))
+def H(dfx, dfz):
+    return (dfx - dfz) / (3*dfz - dfx)
+
+
+# Evalúa fun en los valores x (ya recortados a los elementos idx). Los
+# parámetros que son arreglos (uno por elemento del lote) se recortan a idx
+def _evaluar(fun, x, args, idx):
+    return np.asarray(fun(x, *[p[idx] if np.ndim(p) else p for p in args]), dtype=float)
+
+
+# Método NHO vectorizado sobre un lote de puntos iniciales y/o parámetros.
+# Cada elemento se detiene por separado cuando |f(x_n)| < tol. En cada
+# iteración se evalúan f(z), df(z), df(x) y f(x_{n+1}) una sola vez para los
+# elementos activos; f(x_{n+1}) sirve como error y como f(x) de la siguiente
+def nho_lote(f, df, x0, tol=1e-10, iterMax=100, args=()):
+    """
+    Aproxima raíces de f(x) = 0 con el método NHO para muchos puntos iniciales a la vez.
+
+    Iteración:  z_n = x_n - f(x_n) / df(x_n)
+                x_{n+1} = z_n - H(x_n, z_n) f(z_n) / df(x_n)
+
+    Args:
+        f (callable): f(x, *args), vectorizada en x y en los parámetros.
+        df (callable): Derivada df(x, *args).
+        x0 (float o np.array): Punto(s) inicial(es).
+        tol (float): Tolerancia sobre |f(x_n)|.
+        iterMax (int): Número máximo de iteraciones.
+        args (tuple): Parámetros adicionales; los arreglos se combinan (broadcast) con x0.
+
+    Returns:
+        tuple: (x, iteraciones, errores, convergido). x, iteraciones y convergido tienen
+        la forma del lote; errores (iteraciones máx. x forma del lote) guarda |f(x_n)|
+        de cada iteración, con NaN después de que el elemento se detiene.
+    """
+    arreglos = np.broadcast_arrays(np.asarray(x0, dtype=float), *[np.asarray(p) for p in args])
+    forma = arreglos[0].shape
+    x = arreglos[0].astype(float).ravel()
+    args = [p.ravel() if np.ndim(p0) else p0 for p, p0 in zip(arreglos[1:], args)]
+    N = x.size
+
+    iteraciones = np.zeros(N, dtype=int)
+    convergido = np.zeros(N, dtype=bool)
+    errores = []
+
+    todos = np.arange(N)
+    fx = _evaluar(f, x, args, todos)
+    convergido[np.abs(fx) < tol] = True
+    activos = ~convergido & np.isfinite(fx)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(iterMax):
+            idx = np.flatnonzero(activos)
+            if len(idx) == 0:
+                break
+
+            # Primer paso: predictor z_n (Newton-Raphson), solo para los activos
+            x_idx = x[idx]
+            dfx = _evaluar(df, x_idx, args, idx)
+            z = x_idx - fx[idx] / dfx
+            fz = _evaluar(f, z, args, idx)
+            dfz = _evaluar(df, z, args, idx)
+
+            # Segundo paso: corrector x_{n+1} con el factor H(x_n, z_n)
+            x_idx = z - H(dfx, dfz) * fz / dfx
+            x[idx] = x_idx
+            fx[idx] = _evaluar(f, x_idx, args, idx)
+            iteraciones[idx] += 1
+
+            error = np.full(N, np.nan)
+            error[idx] = np.abs(fx[idx])
+            errores.append(error)
+
+            listo = error[idx] < tol
+            convergido[idx[listo]] = True
+            # Un df nulo o un desborde produce valores no finitos: el elemento se detiene
+            activos[idx[listo | ~np.isfinite(error[idx])]] = False
+
+    errores = np.array(errores).reshape((-1,) + forma)
+    return x.reshape(forma), iteraciones.reshape(forma), errores, convergido.reshape(forma)
+
+
+# Función principal del ejercicio: x0 = 0 con las tolerancias del módulo.
+# Retorna la aproximación, los errores y los números de iteración
+def NHO():
+    x, iteraciones, errores, _ = nho_lote(f, df, 0.0, tol, iterMax)
+    return float(x), list(errores), list(range(1, int(iteraciones) + 1))
+
+
+if __name__ == "__main__":
+    import time
+    import matplotlib.pyplot as plt
+
+    # Ejecución del método
+    x, errores, iters = NHO()
+    print(f"Raíz aproximada: {x} en {len(iters)} iteraciones")
+
+    # Lote de puntos iniciales
+    x0 = np.linspace(-5, 5, 100001)
+    t0 = time.perf_counter()
+    raices, iteraciones, _, convergido = nho_lote(f, df, x0)
+    print(f"{x0.size} puntos iniciales en {time.perf_counter() - t0:.3f} s: "
+          f"{convergido.sum()} convergieron, máximo {iteraciones.max()} iteraciones")
+
+    # Familia de ecuaciones x^2 - e^x - 3x + c = 0 para muchos valores de c
+    c = np.linspace(0, 10, 1001)
+    raices, iteraciones, _, convergido = nho_lote(lambda x, c: x**2 - np.exp(x) - 3*x + c,
+                                                  lambda x, c: 2*x - np.exp(x) - 3, 0.0, args=(c,))
+    print(f"Parámetro c en [0, 10]: {convergido.sum()} de {c.size} convergieron")
+
+    # Gráfica de error vs. iteraciones
+    plt.plot(iters, errores, marker='o')
+    plt.yscale('log')  # Escala logarítmica en el eje Y para visualizar convergencia
+    plt.xlabel("Iteraciones")
+    plt.ylabel("Error")
+    plt.title("Aproximación de la solución usando el método NHO")
+    plt.grid(True)
+    plt.show()
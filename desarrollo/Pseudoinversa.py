@@ -0,0 +1,134 @@
+import math
+import time
+
+import numpy as np
+
+# Parámetros globales
+tol = 1e-5
+max_iter = 100
+
+
+# Construcción de la matriz A de tamaño 45x30 con elementos A[i,j] = (i+1)^2 + (j+1)^2
+def A():
+    return np.add.outer(np.arange(1, 46)**2, np.arange(1, 31)**2).astype(float)
+
+
+# Cálculo de la matriz inicial X_0 = A^T / ||A||²_2
+def X0(A):
+    norm_A2 = np.linalg.norm(A, 2)**2
+    return A.T / norm_A2
+
+
+# Coeficientes c_q = (-1)^{q-1} p! / (q! (p-q)!) para q = 1, ..., p
+def coeficientes(p):
+    return [(-1)**(q - 1) * math.comb(p, q) for q in range(1, p + 1)]
+
+
+# Evalúa S(M) = sum_{q=1}^{p} c_q M^{q-1} con el esquema de Horner:
+# S = c_p I;  S = S M + c_q I  para q = p-1, ..., 1  (p-1 productos)
+def horner(M, coef):
+    S = np.zeros_like(M)
+    np.fill_diagonal(S, coef[-1])
+    for c in coef[-2::-1]:
+        S = S @ M
+        S[np.diag_indices_from(S)] += c
+    return S
+
+
+# Método iterativo de Li y Li para aproximar la pseudoinversa de A:
+# X_{k+1} = X_k S(A X_k). Como X (A X)^j = (X A)^j X, también
+# X_{k+1} = S(X_k A) X_k; se usa la forma cuyo producto cuadrado es el más
+# pequeño (A X es m x m, X A es n x n). El producto A X_{k+1} (o X_{k+1} A) que
+# necesita la siguiente iteración es el mismo que da el residuo
+# ||A X_{k+1} A - A||_F, así que no se calcula dos veces
+def pseudo_inversa(A, p):
+    """
+    Aproxima la pseudoinversa de A con el método de Li y Li de orden p.
+
+    Args:
+        A (np.array): Matriz (m x n).
+        p (int): Orden del método (p = 1 no modifica X_0).
+
+    Returns:
+        tuple: (iteraciones, X) con el número de iteraciones y la pseudoinversa aproximada (n x m).
+    """
+    m, n = A.shape
+    coef = coeficientes(p)
+    X = X0(A)
+    izquierda = m <= n
+
+    # P = A X (m x m) o X A (n x n)
+    P = A @ X if izquierda else X @ A
+    iters = 0
+    for _ in range(max_iter):
+        S = horner(P, coef)
+        X = X @ S if izquierda else S @ X
+        iters += 1
+
+        if izquierda:
+            P = A @ X
+            error = np.linalg.norm(P @ A - A, "fro")
+        else:
+            P = X @ A
+            error = np.linalg.norm(A @ P - A, "fro")
+        if error < tol:
+            break
+
+    return iters, X
+
+
+# Operaciones de punto flotante aproximadas de una iteración: p-1 productos
+# k x k (Horner), la actualización de X, el producto A X (o X A) y el residuo,
+# con k = min(m, n) y l = max(m, n)
+def costo_iteracion(m, n, p):
+    k, l = min(m, n), max(m, n)
+    return 2 * (p - 1) * k**3 + 6 * k**2 * l
+
+
+# Compara los órdenes p por tiempo real (no solo por iteraciones) y reporta
+# el p más barato. Retorna una lista de diccionarios (p, iteraciones, tiempo, flops)
+def benchmark_p(A, ps=range(1, 11), repeticiones=1):
+    m, n = A.shape
+    resultados = []
+    print(f"Matriz {m} x {n}")
+    print(f"{'p':>3} {'iteraciones':>12} {'tiempo (s)':>11} {'Gflop estimados':>16}")
+    for p in ps:
+        tiempos = []
+        for _ in range(repeticiones):
+            t0 = time.perf_counter()
+            iters, _ = pseudo_inversa(A, p)
+            tiempos.append(time.perf_counter() - t0)
+        fila = {"p": p, "iteraciones": iters, "tiempo": min(tiempos),
+                "flops": iters * costo_iteracion(m, n, p)}
+        resultados.append(fila)
+        print(f"{p:>3} {iters:>12} {fila['tiempo']:>11.4f} {fila['flops'] / 1e9:>16.3f}")
+
+    mejor = min(resultados, key=lambda fila: fila["tiempo"])
+    print(f"p más barato: {mejor['p']} ({mejor['tiempo']:.4f} s)")
+    return resultados
+
+
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    # Rango de valores de p a evaluar (de 1 a 10)
+    ps = list(range(1, 11))
+    resultados = benchmark_p(A(), ps)
+
+    # Comparación con la pseudoinversa de NumPy
+    _, X = pseudo_inversa(A(), 3)
+    print("Diferencia máx. con np.linalg.pinv:", np.max(np.abs(X - np.linalg.pinv(A()))))
+
+    # Gráfica: Valor de p vs. Número de iteraciones y tiempo
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+    ax1.plot(ps, [fila["iteraciones"] for fila in resultados], marker='o')
+    ax1.set_xlabel("Valor de p")
+    ax1.set_ylabel("Número de iteraciones")
+    ax1.grid(True)
+    ax2.plot(ps, [fila["tiempo"] for fila in resultados], marker='o')
+    ax2.set_xlabel("Valor de p")
+    ax2.set_ylabel("Tiempo (s)")
+    ax2.grid(True)
+    fig.suptitle("p vs Iteraciones y tiempo (Método Pseudoinversa de Li y Li)")
+    plt.tight_layout()
+    plt.show()
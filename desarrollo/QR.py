@@ -0,0 +1,149 @@
+import time
+
+import numpy as np
+
+
+# Proyecta la columna a contra todas las columnas ya calculadas de Q con un
+# solo producto matriz-vector: r = Q^T a,  u = a - Q r
+def proyectar(Q, a):
+    r = Q.T @ a
+    return a - Q @ r, r
+
+
+# Factorización QR por Gram-Schmidt (columna por columna).
+#   metodo="cgs":  Gram-Schmidt clásico, u_k = a_k - sum_j <a_k, e_j> e_j
+#   metodo="cgs2": clásico con reortogonalización (se proyecta dos veces);
+#                  mantiene ||Q^T Q - I|| cerca del épsilon de máquina
+#   metodo="mgs":  Gram-Schmidt modificado; al calcular e_k se resta su
+#                  componente de todas las columnas restantes a la vez
+def fact_qr(A, metodo="cgs"):
+    """
+    Calcula la factorización A = QR con el proceso de Gram-Schmidt.
+
+    Args:
+        A (np.array): Matriz m x n con m >= n y columnas linealmente independientes.
+        metodo (str): "cgs" (clásico), "mgs" (modificado) o "cgs2" (clásico con reortogonalización).
+
+    Returns:
+        tuple: (Q, R) con Q de columnas ortonormales (m x n) y R triangular superior (n x n).
+    """
+    A = np.array(A, dtype=float)
+    m, n = A.shape
+    Q = np.zeros((m, n))
+    R = np.zeros((n, n))
+
+    if metodo == "mgs":
+        # Se trabaja con A transpuesta para que cada columna sea una fila contigua
+        W = A.T.copy()
+        for k in range(n):
+            R[k, k] = np.linalg.norm(W[k])
+            if R[k, k] == 0:
+                raise ValueError("Columna linealmente dependiente detectada")
+            W[k] /= R[k, k]
+            R[k, k + 1:] = W[k + 1:] @ W[k]
+            W[k + 1:] -= np.outer(R[k, k + 1:], W[k])
+        Q[:] = W.T
+        return Q, R
+
+    if metodo not in ("cgs", "cgs2"):
+        raise ValueError(f"Método desconocido: {metodo}")
+
+    for k in range(n):
+        uk, R[:k, k] = proyectar(Q[:, :k], A[:, k])
+        if metodo == "cgs2":
+            uk, r = proyectar(Q[:, :k], uk)
+            R[:k, k] += r
+
+        R[k, k] = np.linalg.norm(uk)
+        if R[k, k] == 0:
+            raise ValueError("Columna linealmente dependiente detectada")
+        Q[:, k] = uk / R[k, k]
+
+    return Q, R
+
+
+# Variante por bloques (BCGS2) para matrices altas y delgadas: las columnas se
+# procesan en paneles de `bloque` columnas. Cada panel se proyecta dos veces
+# contra todo el Q anterior con productos matriz-matriz y luego se factoriza
+# internamente con fact_qr(..., "cgs2")
+def fact_qr_bloques(A, bloque=32):
+    """
+    Calcula la factorización A = QR por paneles de columnas (Gram-Schmidt clásico por bloques
+    con reortogonalización).
+
+    Args:
+        A (np.array): Matriz m x n con m >= n y columnas linealmente independientes.
+        bloque (int): Número de columnas por panel.
+
+    Returns:
+        tuple: (Q, R) con Q de columnas ortonormales (m x n) y R triangular superior (n x n).
+    """
+    A = np.array(A, dtype=float)
+    m, n = A.shape
+    Q = np.zeros((m, n))
+    R = np.zeros((n, n))
+
+    for s in range(0, n, bloque):
+        e = min(s + bloque, n)
+        panel = A[:, s:e]
+        if s > 0:
+            Qs = Q[:, :s]
+            R[:s, s:e] = Qs.T @ panel
+            panel = panel - Qs @ R[:s, s:e]
+            correccion = Qs.T @ panel
+            panel -= Qs @ correccion
+            R[:s, s:e] += correccion
+        Q[:, s:e], R[s:e, s:e] = fact_qr(panel, "cgs2")
+
+    return Q, R
+
+
+# Pérdida de ortogonalidad ||Q^T Q - I||_F
+def perdida_ortogonalidad(Q):
+    return np.linalg.norm(Q.T @ Q - np.eye(Q.shape[1]), "fro")
+
+
+# Compara tiempo, pérdida de ortogonalidad y residuo relativo ||A - QR|| / ||A||
+# de cada variante, para elegir entre velocidad y estabilidad
+def comparar_metodos(A, bloque=32):
+    A = np.asarray(A, dtype=float)
+    variantes = [("cgs", lambda: fact_qr(A, "cgs")),
+                 ("mgs", lambda: fact_qr(A, "mgs")),
+                 ("cgs2", lambda: fact_qr(A, "cgs2")),
+                 (f"bloques ({bloque})", lambda: fact_qr_bloques(A, bloque))]
+    resultados = []
+    print(f"Matriz {A.shape[0]} x {A.shape[1]}, cond = {np.linalg.cond(A):.2e}")
+    print(f"{'método':>14} {'tiempo (s)':>11} {'||QtQ - I||':>12} {'||A - QR||/||A||':>17}")
+    for nombre, factorizar in variantes:
+        t0 = time.perf_counter()
+        Q, R = factorizar()
+        t = time.perf_counter() - t0
+        fila = {"metodo": nombre, "tiempo": t, "ortogonalidad": perdida_ortogonalidad(Q),
+                "residuo": np.linalg.norm(A - Q @ R) / np.linalg.norm(A)}
+        resultados.append(fila)
+        print(f"{nombre:>14} {t:>11.4f} {fila['ortogonalidad']:>12.2e} {fila['residuo']:>17.2e}")
+    return resultados
+
+
+if __name__ == "__main__":
+    A = [
+        [  2, -1,  3,  0,  1, -2,  4, -3,  5,   6],
+        [ -3,  5, -2,  1,  4, -6,  7, -8,  9,  10],
+        [  1, -2,  4, -3,  5, -7,  8, -9, 10,  11],
+        [  4, -3,  1,  2, -5,  6, -7,  8, -9,  10],
+        [ -5,  7, -4,  6,  3, -1,  2, -8,  9, -10],
+        [  6, -4,  5, -7,  8,  1, -3,  2, -9,  10],
+        [ -7,  9, -6,  8, -10, 11,  3, -5,  4, -12],
+        [  8, -6,  7, -9, 10, -12, 13,  5, -4,   3],
+        [ -9, 11, -8, 10, -12, 14, -16, 17,  6,  -5],
+        [ 10, -8,  9, -11, 12, -14, 15, -17, 18,  7]
+    ]
+
+    Q, R = fact_qr(A)
+    print('Q=', Q)
+    print('R=', R)
+
+    # Matriz mal condicionada (columnas de Vandermonde) y matriz alta y delgada
+    x = np.linspace(0, 1, 200)
+    comparar_metodos(np.vander(x, 12, increasing=True))
+    comparar_metodos(np.random.default_rng(0).standard_normal((20000, 256)))
@@ -1,5 +1,32 @@
+import functools
+import importlib.util
+import os
+import sys
+
 import numpy as np
 
+# Ruta del solucionador por bandas compartido con los scripts de DesarrolloB3
+RUTA_TRIDIAGONAL = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "DesarrolloB3", "tridiagonal.py")
+
+
+# Carga DesarrolloB3/tridiagonal.py a partir de la ubicación de este archivo, sin
+# modificar sys.path. Se carga la primera vez que se usa (no al importar este
+# módulo, para no cargar numba/scipy) y se reutiliza si ya estaba importado
+@functools.lru_cache(maxsize=None)
+def _modulo_tridiagonal():
+    if "tridiagonal" in sys.modules:
+        return sys.modules["tridiagonal"]
+    spec = importlib.util.spec_from_file_location("tridiagonal", RUTA_TRIDIAGONAL)
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules["tridiagonal"] = modulo
+    try:
+        spec.loader.exec_module(modulo)
+    except BaseException:
+        del sys.modules["tridiagonal"]
+        raise
+    return modulo
+
 def extract_diagonal(matrix, diag_index):
     #Extrae una diagonal específica de una matriz.
     return np.diag(matrix, k=diag_index)
@@ -13,42 +40,13 @@ def thomas(A, b):
         b (np.array): Vector del lado derecho (n).
     
     Returns:
-        np.array: Solución del sistema (vector x).
+        np.array: Solución del sistema (vector columna x, n x 1).
     """
-    n = len(b)  # Tamaño del sistema (número de ecuaciones)
-
-    # Extracción de las diagonales:
-    a = extract_diagonal(A, -1)  # Subdiagonal (elementos bajo la diagonal principal)
-    c = extract_diagonal(A, 1)    # Superdiagonal (elementos sobre la diagonal principal)
-    d = b.copy()                 # Copia del vector del lado derecho (para no modificar el original)
-    b = extract_diagonal(A, 0)    # Diagonal principal (sobrescribe b, ahora es la diagonal)
-
-    # Inicialización de vectores para el algoritmo:
-    p = np.zeros(n-1)  # Coeficientes modificados (forward sweep)
-    q = np.zeros(n)    # Términos independientes modificados (forward sweep)
-
-    # Paso 1: Forward sweep (cálculo de p y q)
-    # Primer elemento (caso especial i=0)
-    p[0] = c[0] / b[0]
-    q[0] = d[0] / b[0]
+    thomas_bandas = _modulo_tridiagonal().thomas_bandas
 
-    # Elementos intermedios (i=1 hasta i=n-2)
-    for i in range(1, n-1):
-        denom = b[i] - a[i-1] * p[i-1]  # Denominador común
-        p[i] = c[i] / denom
-        q[i] = (d[i] - a[i-1] * q[i-1]) / denom
-
-    # Último elemento (i=n-1)
-    denom = b[n-1] - a[n-2] * p[n-2]
-    q[n-1] = (d[n-1] - a[n-2] * q[n-2]) / denom
-
-    # Paso 2: Backward substitution (solución hacia atrás)
-    x = np.zeros(n)
-    x[n-1] = q[n-1]  # Último valor de x (xn = qn)
-
-    # Iteramos desde el penúltimo elemento hasta el primero (i=n-2 hasta i=0)
-    for i in range(n-2, -1, -1):
-        x[i] = q[i] - p[i] * x[i+1]
+    # Subdiagonal, diagonal principal y superdiagonal de A
+    x = thomas_bandas(extract_diagonal(A, -1), extract_diagonal(A, 0),
+                      extract_diagonal(A, 1), np.ravel(b))
     return x.reshape(-1, 1)
 
 # Función para generar la matriz tridiagonal y el vector b solicitada
@@ -72,7 +70,26 @@ def matrix_generator():
         b[j] = -14
     return A, b
 
-# Resolver el sistema
-A, b = matrix_generator()
-x = thomas(A, b)
-print("Solucion:", x) 
\ No newline at end of file
+# Mismo sistema que matrix_generator, pero solo con sus diagonales (memoria O(n)).
+# Retorna la subdiagonal, la diagonal, la superdiagonal y el lado derecho
+def matrix_generator_bandas(n=100):
+    a = np.ones(n - 1)         # Subdiagonal
+    b = np.full(n, 5.0)        # Diagonal principal
+    c = np.ones(n - 1)         # Superdiagonal
+    d = np.full(n, -14.0)      # Lado derecho
+    d[0] = -12
+    d[-1] = -12
+    return a, b, c, d
+
+if __name__ == "__main__":
+    thomas_bandas = _modulo_tridiagonal().thomas_bandas
+
+    # Resolver el sistema
+    A, b = matrix_generator()
+    x = thomas(A, b)
+    print("Solucion:", x)
+
+    # Mismo sistema guardado por bandas; funciona igual para n = 10**6
+    a, diag, c, d = matrix_generator_bandas()
+    x_bandas = thomas_bandas(a, diag, c, d)
+    print("Diferencia con la version densa:", np.max(np.abs(x_bandas - x.ravel())))